@@ -5,9 +5,23 @@ Demonstrates advanced commenting, type hints, and professional Python practices.
 
 Author: Marcel Kaled
 Date: 2025-09-24
-Version: 1.1
+Version: 1.5
 """
 
+import math
+import sys
+import time
+import tracemalloc
+import weakref
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import TextIO
+
+import numpy as np
+
+REPORT_PAGE_SIZE = 10_000  # customers rendered per bulk write in reports
+
 
 class Customer:
     """
@@ -25,6 +39,9 @@ class Customer:
         self._name = name
         self._age = age
         self._email = email
+        # Callbacks notified with (customer, old_age) after an age change;
+        # a shared empty tuple keeps unobserved customers as small as before
+        self._age_listeners: tuple[Callable[["Customer", int], None], ...] = ()
 
     @property
     def name(self) -> str:
@@ -50,39 +67,412 @@ class Customer:
         """
         if value <= 0:
             raise ValueError("Age must be positive")
+        old_age = self._age
         self._age = value
+        for listener in self._age_listeners:
+            listener(self, old_age)
 
     @property
     def email(self) -> str:
         """Public getter for the customer's email"""
         return self._email
 
+    def add_age_listener(self, listener: Callable[["Customer", int], None]) -> None:
+        """
+        Registers a callback run after every age change.
+
+        Args:
+            listener (Callable[[Customer, int], None]): Called with the customer
+                and its previous age
+        """
+        self._age_listeners = (*self._age_listeners, listener)
+
+    def remove_age_listener(self, listener: Callable[["Customer", int], None]) -> None:
+        """Unregisters a callback added with add_age_listener."""
+        listeners = list(self._age_listeners)
+        listeners.remove(listener)
+        self._age_listeners = tuple(listeners)
+
+
+class AgeIndex:
+    """
+    Sorted index over Customer.age
+    Answers threshold, range and count queries by binary search and stays
+    sorted incrementally when a customer's age setter is used.
+
+    Entries are keyed by (age, id(customer)), so every customer has a unique,
+    directly searchable position even when many share the same age.
+
+    Customers hold only a weak reference to the index: when an unused index
+    is garbage collected, its listener is detached from every customer.
+    close() detaches it immediately.
+    """
+
+    def __init__(self, customers: Iterable[Customer] = ()):
+        ordered = sorted(customers, key=lambda c: (c.age, id(c)))
+        self._keys: list[tuple[int, int]] = [(c.age, id(c)) for c in ordered]
+        if len(set(self._keys)) != len(self._keys):
+            raise ValueError("Customers must not be indexed twice")
+        self._customers: list[Customer] = ordered
+        self._listener = self._weak_listener()
+        for customer in ordered:
+            customer.add_age_listener(self._listener)
+
+    def add(self, customer: Customer) -> None:
+        """
+        Inserts a customer at its sorted position.
+
+        Args:
+            customer (Customer): Customer to index
+
+        Raises:
+            ValueError: if the customer is already in the index
+        """
+        self._insert(customer)
+        customer.add_age_listener(self._listener)
+
+    def remove(self, customer: Customer) -> None:
+        """
+        Removes a customer from the index.
+
+        Args:
+            customer (Customer): Indexed customer
+
+        Raises:
+            ValueError: if the customer is not in the index
+        """
+        self._delete(customer, customer.age)
+        customer.remove_age_listener(self._listener)
+
+    def close(self) -> None:
+        """Detaches the index from every indexed customer and empties it."""
+        for customer in self._customers:
+            customer.remove_age_listener(self._listener)
+        self._keys.clear()
+        self._customers.clear()
+
+    def at_least(self, min_age: float) -> list[Customer]:
+        """Customers with age >= min_age, youngest first."""
+        return self._customers[bisect_left(self._keys, (min_age,)) :]
+
+    def between(self, min_age: float, max_age: float) -> list[Customer]:
+        """Customers with min_age <= age <= max_age, youngest first."""
+        start, stop = self._bounds(min_age, max_age)
+        return self._customers[start:stop]
+
+    def count_at_least(self, min_age: float) -> int:
+        """Number of customers with age >= min_age."""
+        return len(self._keys) - bisect_left(self._keys, (min_age,))
+
+    def count_between(self, min_age: float, max_age: float) -> int:
+        """Number of customers with min_age <= age <= max_age."""
+        start, stop = self._bounds(min_age, max_age)
+        return max(stop - start, 0)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _bounds(self, min_age: float, max_age: float) -> tuple[int, int]:
+        # (age,) sorts before and (age, inf) after every (age, id) key, so
+        # these are the positions of the first age >= min_age and the first
+        # age > max_age, for integer and fractional bounds alike
+        return (
+            bisect_left(self._keys, (min_age,)),
+            bisect_right(self._keys, (max_age, math.inf)),
+        )
+
+    def _insert(self, customer: Customer) -> None:
+        key = (customer.age, id(customer))
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            raise ValueError("Customer is already in the index")
+        self._keys.insert(position, key)
+        self._customers.insert(position, customer)
+
+    def _delete(self, customer: Customer, age: int) -> None:
+        key = (age, id(customer))
+        position = bisect_left(self._keys, key)
+        if position == len(self._keys) or self._keys[position] != key:
+            raise ValueError("Customer is not in the index")
+        del self._keys[position]
+        del self._customers[position]
+
+    def _on_age_change(self, customer: Customer, old_age: int) -> None:
+        self._delete(customer, old_age)
+        self._insert(customer)
+
+    def _weak_listener(self) -> Callable[[Customer, int], None]:
+        # The closure references the index only weakly, so registering it on
+        # customers does not keep the index alive; once the index is
+        # collected, the callback detaches the closure from its customers
+        customers = self._customers
+
+        def detach(_ref: weakref.WeakMethod) -> None:
+            for customer in customers:
+                customer.remove_age_listener(on_age_change)
+
+        method_ref = weakref.WeakMethod(self._on_age_change, detach)
+
+        def on_age_change(customer: Customer, old_age: int) -> None:
+            method = method_ref()
+            if method is not None:
+                method(customer, old_age)
+
+        return on_age_change
+
+
+class CustomerView:
+    """
+    Lightweight view of one row of a CustomerStore.
+
+    Exposes the same public properties as Customer, but stores only a
+    reference to the store and a row index (no per-instance __dict__).
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CustomerStore", index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        """Public getter for the customer's name"""
+        return self._store.names[self._index]
+
+    @property
+    def age(self) -> int:
+        """Public getter for the customer's age"""
+        return int(self._store.ages[self._index])
+
+    @age.setter
+    def age(self, value: int):
+        """
+        Setter for customer's age, written through to the store.
+
+        Raises:
+            ValueError: if value <= 0
+        """
+        if value <= 0:
+            raise ValueError("Age must be positive")
+        self._store.ages[self._index] = value
+
+    @property
+    def email(self) -> str:
+        """Public getter for the customer's email"""
+        return self._store.emails[self._index]
+
+    def __repr__(self) -> str:
+        return f"CustomerView({self.name!r}, {self.age}, {self.email!r})"
+
+
+class CustomerStore:
+    """
+    Columnar customer storage
+    Keeps names, ages and emails as parallel arrays so that large customer
+    sets use little memory and can be filtered with vectorized masks.
+
+    Attributes:
+        names (np.ndarray): Customer names (object array)
+        ages (np.ndarray): Customer ages (int32 array)
+        emails (np.ndarray): Customer emails (object array)
+    """
+
+    def __init__(
+        self, names: Sequence[str], ages: Sequence[int], emails: Sequence[str]
+    ):
+        self.names = np.asarray(names, dtype=object)
+        self.ages = np.asarray(ages, dtype=np.int32)
+        self.emails = np.asarray(emails, dtype=object)
+        if not len(self.names) == len(self.ages) == len(self.emails):
+            raise ValueError("names, ages and emails must have the same length")
+        if (self.ages <= 0).any():
+            raise ValueError("Age must be positive")
+
+    @classmethod
+    def from_customers(cls, customers: Iterable[Customer]) -> "CustomerStore":
+        """
+        Builds a store from Customer objects.
+
+        Args:
+            customers (Iterable[Customer]): Customers to copy into the store
+
+        Returns:
+            CustomerStore: Columnar copy of the customers
+        """
+        rows = [(c.name, c.age, c.email) for c in customers]
+        names, ages, emails = zip(*rows) if rows else ((), (), ())
+        return cls(names, ages, emails)
+
+    def select(self, mask: np.ndarray) -> "CustomerStore":
+        """
+        Returns a new store with the rows selected by a boolean mask.
+
+        Args:
+            mask (np.ndarray): Boolean array aligned with the store rows
+
+        Returns:
+            CustomerStore: Store holding only the selected rows
+        """
+        subset = CustomerStore.__new__(CustomerStore)
+        subset.names = self.names[mask]
+        subset.ages = self.ages[mask]
+        subset.emails = self.emails[mask]
+        return subset
 
-def filter_customers_by_age(customers: list[Customer], min_age: int) -> list[Customer]:
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def __getitem__(self, index: int) -> CustomerView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("CustomerStore index out of range")
+        return CustomerView(self, index % len(self))
+
+    def __iter__(self) -> Iterator[CustomerView]:
+        return (CustomerView(self, i) for i in range(len(self)))
+
+
+def filter_customers_by_age(
+    customers: list[Customer] | CustomerStore | AgeIndex, min_age: int
+) -> list[Customer] | CustomerStore:
     """
     Filters customers with age equal or greater than min_age.
 
+    A CustomerStore is filtered with a single vectorized mask over its ages,
+    and an AgeIndex answers with a binary search, instead of a Python-level scan.
+
     Args:
-        customers (List[Customer]): List of Customer objects
+        customers (List[Customer] | CustomerStore | AgeIndex): Customers to filter
         min_age (int): Minimum age for filtering
 
     Returns:
-        List[Customer]: List of filtered customers
+        List[Customer] | CustomerStore: Filtered customers; a store for a store
+        input, otherwise a list
     """
+    if isinstance(customers, CustomerStore):
+        return customers.select(customers.ages >= min_age)
+    if isinstance(customers, AgeIndex):
+        return customers.at_least(min_age)
     return [c for c in customers if c.age >= min_age]
 
 
-def customer_report(customers: list[Customer]) -> None:
+def compare_customer_storage(n_customers: int = 1_000_000) -> dict[str, float]:
     """
-    Generates a simple customer report.
+    Compares memory and filter time of a Customer list against a CustomerStore.
+
+    Names and emails are built once and shared, so the memory figures only
+    count the per-customer containers (objects vs arrays).
+
+    Args:
+        n_customers (int): Number of synthetic customers
+
+    Returns:
+        dict[str, float]: Peak memory (MB) to build and seconds to filter, per storage
+    """
+    names = [f"Customer {i}" for i in range(n_customers)]
+    emails = [f"customer{i}@email.com" for i in range(n_customers)]
+    ages = np.random.default_rng(0).integers(18, 90, size=n_customers).tolist()
+
+    tracemalloc.start()
+    objects = [Customer(n, a, e) for n, a, e in zip(names, ages, emails)]
+    objects_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = CustomerStore(names, ages, emails)
+    store_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    filter_customers_by_age(objects, 65)
+    objects_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    filter_customers_by_age(store, 65)
+    store_s = time.perf_counter() - start
+
+    return {
+        "objects_mb": objects_mb,
+        "store_mb": store_mb,
+        "objects_filter_s": objects_s,
+        "store_filter_s": store_s,
+    }
+
+
+def iter_report_pages(
+    customers: Iterable[Customer | CustomerView],
+    page_size: int = REPORT_PAGE_SIZE,
+    offset: int = 0,
+    limit: int | None = None,
+) -> Iterator[str]:
+    """
+    Lazily renders report lines, one text block per page.
+
+    Only one page is held in memory at a time, whatever the number of customers.
 
     Args:
-        customers (List[Customer]): List of customers to display
+        customers (Iterable[Customer | CustomerView]): Customers to render,
+            consumed lazily
+        page_size (int): Number of customers per page
+        offset (int): Number of leading customers to skip
+        limit (int | None): Maximum number of customers to render; None for all
+
+    Yields:
+        str: Newline-terminated report lines for one page
+
+    Raises:
+        ValueError: if page_size <= 0, offset < 0 or limit < 0
     """
-    print("=== Customer Report ===")
-    for customer in customers:
+    if page_size <= 0 or offset < 0:
+        raise ValueError("page_size must be positive and offset non-negative")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be non-negative or None")
+    stop = None if limit is None else offset + limit
+    rows = islice(customers, offset, stop)
+    while page := list(islice(rows, page_size)):
         # Use public properties, avoiding access to protected members
-        print(f"{customer.name} - {customer.age} years old - {customer.email}")
+        yield "".join(f"{c.name} - {c.age} years old - {c.email}\n" for c in page)
+
+
+def write_customer_report(
+    customers: Iterable[Customer | CustomerView],
+    stream: TextIO | None = None,
+    page_size: int = REPORT_PAGE_SIZE,
+    offset: int = 0,
+    limit: int | None = None,
+) -> int:
+    """
+    Writes a customer report to any text stream, one bulk write per page.
+
+    Args:
+        customers (Iterable[Customer | CustomerView]): Customers to report
+        stream (TextIO | None): Destination, e.g. an open file; defaults to stdout
+        page_size (int): Number of customers per page
+        offset (int): Number of leading customers to skip
+        limit (int | None): Maximum number of customers to report; None for all
+
+    Returns:
+        int: Number of pages written
+    """
+    out = stream if stream is not None else sys.stdout
+    out.write("=== Customer Report ===\n")
+    pages = 0
+    for pages, page in enumerate(
+        iter_report_pages(customers, page_size, offset, limit), start=1
+    ):
+        out.write(page)
+    out.flush()
+    return pages
+
+
+def customer_report(customers: Iterable[Customer | CustomerView]) -> None:
+    """
+    Generates a simple customer report.
+
+    Args:
+        customers (Iterable[Customer | CustomerView]): Customers to display
+    """
+    write_customer_report(customers)
 
 
 # --- Usage Example ---
@@ -99,3 +489,31 @@ if __name__ == "__main__":
 
     # Generating final report
     customer_report(older_customers)
+
+    # Same report from columnar storage
+    customer_store = CustomerStore.from_customers(example_customers)
+    customer_report(filter_customers_by_age(customer_store, 25))
+
+    # Repeated age queries through a sorted index
+    age_index = AgeIndex(example_customers)
+    print("=== Age Index ===")
+    print("Customers aged 25+  :", age_index.count_at_least(25))
+    print("Customers aged 20-35:", age_index.count_between(20, 35))
+    example_customers[1].age = 26  # The setter re-sorts the index incrementally
+    print("After update, 25+   :", [c.name for c in age_index.at_least(25)])
+    age_index.close()  # Stop tracking age changes
+
+    # Paginated report: skip the first customer, write one customer per page
+    write_customer_report(example_customers, sys.stdout, page_size=1, offset=1)
+
+    # Memory and speed comparison on a large synthetic customer set
+    comparison = compare_customer_storage(200_000)
+    print("=== Storage Comparison (200,000 customers) ===")
+    print(
+        f"Customer objects: {comparison['objects_mb']:.1f} MB, "
+        f"filter {comparison['objects_filter_s'] * 1000:.1f} ms"
+    )
+    print(
+        f"CustomerStore   : {comparison['store_mb']:.1f} MB, "
+        f"filter {comparison['store_filter_s'] * 1000:.1f} ms"
+    )
@@ -4,23 +4,21 @@ Module: Advanced Output with Native Typing
 Demonstrates advanced output in Python 3.12 using:
 - Colored output
 - Formatted tables
-- Logging
+- Logging (non-blocking, queue-based)
 - Native type hints
 - Pylint-clean code
 
 Author: Marcel Kaled
 Date: 2025-09-24
-Version: 1.1
+Version: 1.2
 """
 
 import logging
 
+from c2_outputs_logging import setup_async_logging
+
 # --- Logging Configuration ---
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+setup_async_logging(level=logging.INFO)
 
 # --- ANSI Color Codes ---
 
@@ -6,9 +6,85 @@ from basic prints to formatted and advanced outputs.
 
 Author: Marcel Kaled
 Date: 2025-09-24
-Version: 1.0
+Version: 1.1
 """
 
+import io
+import sys
+import threading
+from typing import TextIO
+
+
+class OutputBuffer:
+    """
+    Buffered text writer for use as ``print(..., file=buffer)``.
+
+    Output is gathered in memory and written to the stream in one call when
+    the buffer reaches ``max_chars``, when a timer fires ``max_delay``
+    seconds after the first write since the last flush (even if the producer
+    pauses), or when the ``with`` block ends. With ``realtime=True`` output
+    is line-buffered: it is flushed at every newline, and
+    ``print(..., flush=True)`` flushes explicitly in either mode.
+
+    Args:
+        stream (TextIO | None): Destination stream; defaults to ``sys.stdout``
+        max_chars (int): Buffered characters that trigger a flush
+        max_delay (float): Seconds pending text may wait before a timed flush
+        realtime (bool): Flush at every newline instead of batching lines
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        max_chars: int = 8_192,
+        max_delay: float = 0.5,
+        realtime: bool = False,
+    ):
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.realtime = realtime
+        self._buffer = io.StringIO()
+        self._lock = threading.Lock()  # The timer flushes from its own thread
+        self._timer: threading.Timer | None = None
+
+    def write(self, text: str) -> int:
+        """Buffers text, flushing if a size threshold or a newline is reached."""
+        with self._lock:
+            self._buffer.write(text)
+            if self._buffer.tell() >= self.max_chars or (
+                self.realtime and "\n" in text
+            ):
+                self._flush_buffer()
+            elif self._timer is None:
+                # First pending text since the last flush: arm the timed flush
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return len(text)
+
+    def flush(self) -> None:
+        """Writes everything buffered so far with a single write call."""
+        with self._lock:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        # Called with the lock held; the next write re-arms the timer
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer.tell():
+            self.stream.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        self.stream.flush()
+
+    def __enter__(self) -> "OutputBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
 
 def basic_print() -> None:
     """
@@ -61,17 +137,19 @@ def print_collections() -> None:
     fruits: list[str] = ["apple", "banana", "cherry"]
     person: dict[str, any] = {"name": "Bob", "age": 25, "city": "NY"}
 
-    # Printing list
-    print("Fruits:", fruits)
-    for fruit in fruits:
-        print(f"- {fruit}")
+    # Buffered: items are collected and written once when the block ends
+    with OutputBuffer() as out:
+        # Printing list
+        print("Fruits:", fruits, file=out)
+        for fruit in fruits:
+            print(f"- {fruit}", file=out)
 
-    # Printing dictionary
-    print("Person Info:")
-    for key, value in person.items():
-        print(f"  {key}: {value}")
+        # Printing dictionary
+        print("Person Info:", file=out)
+        for key, value in person.items():
+            print(f"  {key}: {value}", file=out)
 
-    print()
+        print(file=out)
 
 
 def advanced_output() -> None:
@@ -83,15 +161,18 @@ def advanced_output() -> None:
     # Using unpacking
     print("Numbers:", *numbers, sep=", ")
 
-    # Printing on same line
-    for number in numbers:
-        print(number, end=" ")
-    print()  # Line break
-
-    # Real-time output
-    for number in numbers:
-        print(number, end=" ", flush=True)
-    print()
+    # Printing on same line (batched into a single write)
+    with OutputBuffer() as out:
+        for number in numbers:
+            print(number, end=" ", file=out)
+        print(file=out)  # Line break
+
+    # Real-time output: flush=True flushes once per print, and realtime
+    # (line-buffered) mode flushes the final line break
+    with OutputBuffer(realtime=True) as out:
+        for number in numbers:
+            print(number, end=" ", file=out, flush=True)
+        print(file=out)
 
 
 def main() -> None:
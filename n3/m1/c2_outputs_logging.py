@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Module: Asynchronous Logging for Output Examples
+Non-blocking logging setup shared by the output modules:
+- Queue-based handler, so log calls never wait on terminal I/O
+- Background listener thread that formats and writes records in batches
+- Bounded queue with a drop or backpressure (block) policy
+- Latency benchmark against a synchronous StreamHandler
+- Native type hints
+- Pylint-clean code
+
+Author: Marcel Kaled
+Date: 2026-10-18
+Version: 1.0
+"""
+
+import copy
+import logging
+import queue
+import statistics
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler
+from typing import TextIO
+
+# --- Logging Defaults ---
+LOG_FORMAT: str = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_DATEFMT: str = "%Y-%m-%d %H:%M:%S"
+LOG_QUEUE_SIZE: int = 10_000  # records buffered before the policy applies
+LOG_BATCH_SIZE: int = 512  # max records written per write() call
+TERMINAL_WRITE_LATENCY: float = 50e-6  # seconds per write() on the benchmark sink
+
+_STOP: object = object()  # sentinel that tells the listener thread to exit
+
+
+class AsyncStreamHandler(QueueHandler):
+    """
+    Logging handler that enqueues records and writes them from a background thread.
+
+    The calling thread only merges the message arguments and puts the record on
+    a bounded queue. A listener thread drains everything queued so far (up to
+    ``LOG_BATCH_SIZE`` records), formats it, and issues a single ``write`` and
+    ``flush`` per batch. ``close()`` (also run by ``logging.shutdown`` at exit)
+    drains the queue before returning.
+
+    Args:
+        stream (TextIO | None): Destination stream; defaults to ``sys.stderr``
+        policy (str): ``"drop"`` discards records when the queue is full and
+            counts them in ``dropped``; ``"block"`` waits for free space
+        queue_size (int): Maximum number of queued records
+    """
+
+    POLICIES: tuple[str, ...] = ("drop", "block")
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        policy: str = "drop",
+        queue_size: int = LOG_QUEUE_SIZE,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.stream: TextIO = stream if stream is not None else sys.stderr
+        self.policy: str = policy
+        self.dropped: int = 0
+        self._listener = threading.Thread(
+            target=self._drain, name="async-log-listener", daemon=True
+        )
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merges message arguments now; full formatting is left to the listener."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queues a record, applying the drop or block policy when full."""
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Flushes pending records and stops the listener thread."""
+        if self._listener.is_alive():
+            self.queue.put(_STOP)
+            self._listener.join()
+        super().close()
+
+    def _drain(self) -> None:
+        """Listener loop: writes whatever is queued as one batch until stopped."""
+        while True:
+            batch: list[object] = [self.queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records: list[object] = [item for item in batch if item is not _STOP]
+            if records:
+                try:
+                    self.stream.write(
+                        "\n".join(self.format(record) for record in records) + "\n"
+                    )
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    self.handleError(records[-1])
+            if len(records) != len(batch):
+                return
+
+
+def setup_async_logging(
+    level: int = logging.INFO,
+    stream: TextIO | None = None,
+    policy: str = "drop",
+    queue_size: int = LOG_QUEUE_SIZE,
+) -> AsyncStreamHandler:
+    """
+    Routes the root logger through an ``AsyncStreamHandler``.
+
+    Drop-in replacement for the ``logging.basicConfig`` calls in the output
+    modules: existing ``logging.info(...)`` call sites keep working unchanged.
+
+    Args:
+        level (int): Root logger level
+        stream (TextIO | None): Destination stream; defaults to ``sys.stderr``
+        policy (str): Full-queue policy, ``"drop"`` or ``"block"``
+        queue_size (int): Maximum number of queued records
+
+    Returns:
+        AsyncStreamHandler: The installed handler, exposing ``dropped``
+    """
+    root: logging.Logger = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    async_handler = AsyncStreamHandler(stream, policy, queue_size)
+    async_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+    root.addHandler(async_handler)
+    root.setLevel(level)
+    return async_handler
+
+
+class _TerminalLikeSink:
+    """Discards text but blocks each write for ``TERMINAL_WRITE_LATENCY`` seconds."""
+
+    def write(self, text: str) -> int:
+        time.sleep(TERMINAL_WRITE_LATENCY)  # releases the GIL, like a blocking syscall
+        return len(text)
+
+    def flush(self) -> None:
+        """Nothing is buffered."""
+
+
+def _time_log_calls(logger: logging.Logger, n_calls: int) -> dict[str, float]:
+    """Returns mean and p99 latency, in microseconds, of ``n_calls`` info calls."""
+    latencies: list[int] = []
+    for i in range(n_calls):
+        start: int = time.perf_counter_ns()
+        logger.info("Processed record %d of %d", i, n_calls)
+        latencies.append(time.perf_counter_ns() - start)
+    latencies.sort()
+    return {
+        "mean_us": statistics.fmean(latencies) / 1_000,
+        "p99_us": latencies[int(len(latencies) * 0.99)] / 1_000,
+    }
+
+
+def benchmark_logging(n_calls: int = 20_000) -> dict[str, dict[str, float]]:
+    """
+    Measures per-call latency of synchronous vs asynchronous logging under load.
+
+    Both variants log ``n_calls`` records back to back to a sink whose writes
+    block like terminal I/O. The synchronous handler pays that cost on every
+    call; the asynchronous one pays it once per batch, in the listener thread.
+
+    Args:
+        n_calls (int): Number of log calls per variant
+
+    Returns:
+        dict[str, dict[str, float]]: Mean and p99 latency per variant
+    """
+    logger: logging.Logger = logging.getLogger(f"{__name__}.benchmark")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter(LOG_FORMAT, LOG_DATEFMT)
+    sink = _TerminalLikeSink()
+    handlers: dict[str, logging.Handler] = {
+        "sync": logging.StreamHandler(sink),
+        "async": AsyncStreamHandler(sink, policy="block"),
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for name, handler in handlers.items():
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        results[name] = _time_log_calls(logger, n_calls)
+        logger.removeHandler(handler)
+        handler.close()
+    return results
+
+
+def main() -> None:
+    """Demonstrates async logging and prints the latency benchmark."""
+    handler: AsyncStreamHandler = setup_async_logging(level=logging.INFO)
+    logging.info("Async logging configured (policy=%s).", handler.policy)
+
+    results: dict[str, dict[str, float]] = benchmark_logging()
+    for name, stats in results.items():
+        logging.info(
+            "%-5s handler: mean %.2f us/call, p99 %.2f us/call",
+            name,
+            stats["mean_us"],
+            stats["p99_us"],
+        )
+    logging.info("Records dropped so far: %d", handler.dropped)
+
+
+# --- Entry Point ---
+if __name__ == "__main__":
+    main()
@@ -6,26 +6,53 @@ Ultra-Professional Dynamic Table Output
 Features:
 - Terminal tables with dynamic alignment
 - Conditional coloring based on user-defined rules
-- Logging integration
+- Logging integration (non-blocking, queue-based)
 - Supports multiple data types (str, int, float)
+- Streaming, batched rendering for large or lazy row sources
+- Columnar fast path for pandas DataFrames and NumPy column dicts
+- Declarative color rules compiled to vectorized np.select
+- Optional bounded LRU cache for repeated formatted cells
+- Live tables that redraw only the cells changed since the last frame
 - Native Python 3.12 type hints
 - NumPy-style docstrings
 - Pylint-clean code
 
 Author: Marcel Kaled
 Date: 2025-09-24
-Version: 5.1
+Version: 5.7
 """
 
 import logging
-from collections.abc import Callable
+import operator
+import sys
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TextIO
+
+import numpy as np
+import pandas as pd
+
+from c2_outputs_logging import setup_async_logging
 
 # ---------------- Logging Configuration ----------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+setup_async_logging(level=logging.INFO)
+
+# ---------------- Streaming Configuration ----------------
+STREAM_SAMPLE_SIZE: int = 1_000  # rows inspected to size columns when streaming
+STREAM_BATCH_SIZE: int = 5_000  # rows rendered per write() call when streaming
+
+# pandas.api.types.infer_dtype kinds that map to a single NumPy dtype
+TYPED_KINDS: dict[str, type] = {
+    "string": np.str_,
+    "integer": np.int64,
+    "floating": np.float64,
+    "boolean": np.bool_,
+}
+
+# ---------------- Cell Cache Configuration ----------------
+CELL_CACHE_SIZE: int = 4_096  # max formatted cells kept by cached_format_cell
 
 # ---------------- ANSI Color Codes ----------------
 
@@ -41,6 +68,28 @@ class Colors:
     BOLD: str = "\033[1m"
 
 
+# ---------------- ANSI Cursor Control ----------------
+
+
+class Cursor:
+    CLEAR_DOWN: str = "\033[J"
+
+    @staticmethod
+    def up(lines: int) -> str:
+        """Moves the cursor up by ``lines`` lines."""
+        return f"\033[{lines}A"
+
+    @staticmethod
+    def down(lines: int) -> str:
+        """Moves the cursor down by ``lines`` lines."""
+        return f"\033[{lines}B"
+
+    @staticmethod
+    def column(col: int) -> str:
+        """Moves the cursor to the 1-based column ``col`` of the current line."""
+        return f"\033[{col}G"
+
+
 # ---------------- Core Functions ----------------
 def print_colored(text: str, color: str = Colors.ENDC) -> None:
     """
@@ -84,9 +133,43 @@ def format_cell(
     return f"{color}{str(value):<{width}}{Colors.ENDC}"
 
 
+CellFormatter = Callable[[str | int | float, int, Callable[[object], str] | None], str]
+
+
+def cached_format_cell(maxsize: int = CELL_CACHE_SIZE) -> CellFormatter:
+    """
+    Builds a ``format_cell`` variant memoized by a bounded LRU cache.
+
+    Entries are keyed by (value, value type, width, color rule), so a hit skips
+    both the color rule call and the f-string construction. Color rules are
+    therefore assumed to be pure. Hit/miss statistics are available through
+    the returned function's ``cache_info()``; ``cache_clear()`` empties it.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of formatted cells kept before evicting the least
+        recently used one.
+
+    Returns
+    -------
+    CellFormatter
+        Drop-in replacement for ``format_cell``.
+
+    Raises
+    ------
+    ValueError
+        If ``maxsize`` is not positive.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be positive.")
+    return lru_cache(maxsize=maxsize, typed=True)(format_cell)
+
+
 def print_dynamic_table(
     data: list[dict[str, str | int | float]],
     color_rules: dict[str, Callable[[object], str]] | None = None,
+    cell_formatter: CellFormatter = format_cell,
 ) -> None:
     """
     Prints a table with dynamic columns, alignment, and optional coloring.
@@ -97,6 +180,9 @@ def print_dynamic_table(
         List of rows; each row is a dict with column names as keys.
     color_rules : dict[str, Callable[[object], str]] | None
         Optional dict mapping column names to functions returning ANSI color codes.
+    cell_formatter : CellFormatter
+        Function used to render each cell, e.g. one built by ``cached_format_cell``
+        to reuse cells across repeated renders.
     """
     if not data:
         logging.warning("No data available for table.")
@@ -115,7 +201,7 @@ def print_dynamic_table(
     # Data rows
     for row in data:
         row_items: list[str] = [
-            format_cell(
+            cell_formatter(
                 row[h], col_widths[h], color_rules.get(h) if color_rules else None
             )
             for h in headers
@@ -123,6 +209,573 @@ def print_dynamic_table(
         print(" | ".join(row_items))
 
 
+def measure_col_widths(
+    headers: list[str],
+    rows: list[dict[str, str | int | float]],
+    col_widths: dict[str, int] | None = None,
+) -> dict[str, int]:
+    """
+    Computes column widths from headers and rows, honoring explicit widths.
+
+    Parameters
+    ----------
+    headers : list[str]
+        Column names, in display order.
+    rows : list[dict[str, str | int | float]]
+        Rows used to measure the widest value of each column.
+    col_widths : dict[str, int] | None
+        Explicit widths that take precedence over measured ones.
+
+    Returns
+    -------
+    dict[str, int]
+        Width per column name.
+    """
+    explicit: dict[str, int] = col_widths or {}
+    return {
+        h: (
+            explicit[h]
+            if h in explicit
+            else max(len(h), *(len(str(row[h])) for row in rows))
+        )
+        for h in headers
+    }
+
+
+def format_header(headers: list[str], col_widths: dict[str, int]) -> str:
+    """
+    Builds the colored header row and separator line, newline-terminated.
+
+    Parameters
+    ----------
+    headers : list[str]
+        Column names, in display order.
+    col_widths : dict[str, int]
+        Width per column name.
+
+    Returns
+    -------
+    str
+        Header and separator lines ready to be written to a stream.
+    """
+    header_row: str = " | ".join(f"{h:<{col_widths[h]}}" for h in headers)
+    separator: str = "-+-".join("-" * col_widths[h] for h in headers)
+    return f"{Colors.BOLD}{Colors.OKBLUE}{header_row}{Colors.ENDC}\n{separator}\n"
+
+
+def print_dynamic_table_stream(  # pylint: disable=too-many-arguments
+    rows: Iterable[dict[str, str | int | float]],
+    color_rules: dict[str, Callable[[object], str]] | None = None,
+    col_widths: dict[str, int] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    stream: TextIO | None = None,
+    *,
+    sample_size: int = STREAM_SAMPLE_SIZE,
+) -> int:
+    """
+    Streams a table from any iterable of rows, writing it in batches.
+
+    Column widths are measured on the first ``sample_size`` rows only (or
+    taken from ``col_widths``), so memory stays flat regardless of the input
+    length. Values wider than their column overflow it instead of being
+    truncated. Each batch is formatted column by column (see
+    ``format_column``): color rules run once per distinct value, not per cell.
+
+    Parameters
+    ----------
+    rows : Iterable[dict[str, str | int | float]]
+        Rows to render; may be a list, a generator or any other iterable.
+    color_rules : dict[str, Callable[[object], str]] | None
+        Optional dict mapping column names to functions returning ANSI color codes.
+    col_widths : dict[str, int] | None
+        Explicit column widths; columns not listed are measured on the sample.
+    batch_size : int
+        Number of rows rendered before each single ``write`` call.
+    stream : TextIO | None
+        Destination stream; defaults to ``sys.stdout``.
+    sample_size : int
+        Number of leading rows buffered to measure column widths.
+
+    Returns
+    -------
+    int
+        Number of data rows written.
+
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` or ``sample_size`` is not positive.
+    """
+    if batch_size < 1 or sample_size < 1:
+        raise ValueError("batch_size and sample_size must be positive.")
+
+    out: TextIO = stream if stream is not None else sys.stdout
+    iterator = iter(rows)
+    sample: list[dict[str, str | int | float]] = list(islice(iterator, sample_size))
+    if not sample:
+        logging.warning("No data available for table.")
+        return 0
+
+    headers: list[str] = list(sample[0].keys())
+    widths: dict[str, int] = measure_col_widths(headers, sample, col_widths)
+    out.write(format_header(headers, widths))
+
+    written: int = 0
+    remaining = chain(sample, iterator)
+    while batch := list(islice(remaining, batch_size)):
+        columns: dict[str, np.ndarray] = {
+            h: np.fromiter((row[h] for row in batch), dtype=object, count=len(batch))
+            for h in headers
+        }
+        out.write(format_rows(columns, widths, color_rules))
+        written += len(batch)
+
+    out.flush()
+    return written
+
+
+# ---------------- Compiled Color Rules ----------------
+class ColorRule:
+    """
+    Declarative color rule compiled once and applied to whole columns.
+
+    The spec mirrors an if-chain: conditions are checked in order and the
+    first match wins; values matching none of them get ``default``.
+
+    Parameters
+    ----------
+    conditions : list[tuple[str, float, str]]
+        Ordered ``(operator, threshold, color)`` triples, where operator is one
+        of ``<``, ``<=``, ``>``, ``>=``, ``==`` or ``!=``.
+    default : str
+        Color used when no condition matches.
+
+    Examples
+    --------
+    >>> rule = ColorRule([(">=", 90, Colors.OKGREEN)], default=Colors.FAIL)
+    >>> rule(95) == Colors.OKGREEN
+    True
+    """
+
+    OPERATORS: dict[str, Callable[[object, object], object]] = {
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "==": operator.eq,
+        "!=": operator.ne,
+    }
+
+    def __init__(
+        self, conditions: list[tuple[str, float, str]], default: str = Colors.ENDC
+    ):
+        unknown: set[str] = {op for op, _, _ in conditions} - set(self.OPERATORS)
+        if unknown:
+            raise ValueError(f"Unsupported operators: {sorted(unknown)}")
+        self._checks: tuple[tuple[Callable[[object, object], object], float], ...] = (
+            tuple((self.OPERATORS[op], threshold) for op, threshold, _ in conditions)
+        )
+        self._colors: list[str] = [color for _, _, color in conditions]
+        self._default: str = default
+
+    def __call__(self, value: object) -> str:
+        """Scalar fallback, usable wherever a per-cell color callable is expected."""
+        for (compare, threshold), color in zip(self._checks, self._colors):
+            if compare(value, threshold):
+                return color
+        return self._default
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """
+        Resolves the color of every value in a column with a single ``np.select``.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Numeric column values.
+
+        Returns
+        -------
+        np.ndarray
+            String array of ANSI color codes aligned with ``values``; all
+            ``default`` when the rule has no conditions.
+        """
+        if not self._checks:
+            return np.full(np.shape(values), self._default)
+        condlist: list[np.ndarray] = [
+            compare(values, threshold) for compare, threshold in self._checks
+        ]
+        return np.select(condlist, self._colors, default=self._default)
+
+
+# ---------------- Columnar Fast Path ----------------
+def typed_column(values: np.ndarray) -> np.ndarray:
+    """
+    Converts a homogeneous object column to a typed array.
+
+    Columns built from row dicts (and pandas string columns) arrive as object
+    arrays; when every value has the same kind they can take the vectorized
+    str/int/float/bool paths. Mixed columns are returned unchanged.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Raw column values.
+
+    Returns
+    -------
+    np.ndarray
+        Typed array, or ``values`` itself when no single type fits.
+    """
+    if values.dtype != np.object_:
+        return values
+    kind: str = pd.api.types.infer_dtype(values, skipna=False)
+    target: type | None = TYPED_KINDS.get(kind)
+    if target is None:
+        return values
+    try:
+        return values.astype(target)
+    except OverflowError:  # ints beyond int64 stay Python objects
+        return values
+
+
+def factorize_cells(values: np.ndarray) -> tuple[np.ndarray, list[object]]:
+    """
+    Splits a column into distinct cell values and their positions.
+
+    Unlike ``np.unique`` this needs no ordering, so object columns that mix
+    strings, numbers and missing values work. Missing values keep one entry
+    per type (``None``, ``nan``, ``pd.NA``...), since each prints differently.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Raw column values.
+
+    Returns
+    -------
+    tuple[np.ndarray, list[object]]
+        ``inverse`` such that ``uniques[inverse[i]]`` equals ``values[i]``,
+        and the distinct values as Python objects.
+    """
+    inverse, distinct = pd.factorize(values)  # missing values get code -1
+    uniques: list[object] = list(distinct.tolist())
+    slots: dict[type, int] = {}
+    for position in np.flatnonzero(inverse == -1).tolist():
+        value: object = values[position : position + 1].tolist()[0]
+        if type(value) not in slots:
+            slots[type(value)] = len(uniques)
+            uniques.append(value)
+        inverse[position] = slots[type(value)]
+    return inverse, uniques
+
+
+def column_colors(
+    values: np.ndarray, color_rule: Callable[[object], str] | None = None
+) -> np.ndarray | str:
+    """
+    Resolves the ANSI color code of every value in a column.
+
+    A ``ColorRule`` is evaluated vectorized over the whole column; any other
+    callable is called once per distinct value rather than once per cell.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Raw column values.
+    color_rule : Callable[[object], str] | None
+        Function returning ANSI color code based on value.
+
+    Returns
+    -------
+    np.ndarray | str
+        Array of color codes aligned with ``values``, or ``Colors.ENDC``
+        when no rule is given.
+    """
+    if color_rule is None:
+        return Colors.ENDC
+    if isinstance(color_rule, ColorRule):
+        return color_rule.apply(values)
+    inverse, uniques = factorize_cells(values)
+    codes: np.ndarray = np.array([color_rule(u) for u in uniques], dtype=np.str_)
+    return codes[inverse]
+
+
+def format_column(
+    values: np.ndarray,
+    width: int,
+    color_rule: Callable[[object], str] | None = None,
+) -> np.ndarray:
+    """
+    Formats a whole column at once, mirroring ``format_cell`` cell by cell.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Raw column values.
+    width : int
+        Column width for alignment.
+    color_rule : Callable[[object], str] | None
+        Function returning ANSI color code based on value.
+
+    Returns
+    -------
+    np.ndarray
+        String array of formatted and colored cells.
+    """
+    values = typed_column(values)
+    if values.dtype.kind in "biuf":
+        # format_cell formats bools through int.__format__, i.e. as 1 / 0
+        numbers: np.ndarray = (
+            values.astype(np.int8) if values.dtype == np.bool_ else values
+        )
+        padded: np.ndarray = np.strings.rjust(numbers.astype(np.str_), width)
+    elif values.dtype.kind == "U":
+        padded = np.strings.ljust(values, width)
+    else:
+        # Mixed object columns: format each distinct value exactly like
+        # format_cell (numbers right-aligned, the rest left)
+        inverse, uniques = factorize_cells(values)
+        padded = np.array(
+            [
+                format_cell(value, width).removeprefix(Colors.ENDC)[: -len(Colors.ENDC)]
+                for value in uniques
+            ],
+            dtype=np.str_,
+        )[inverse]
+    colored: np.ndarray = np.strings.add(column_colors(values, color_rule), padded)
+    return np.strings.add(colored, Colors.ENDC)
+
+
+def print_columnar_table(
+    data: pd.DataFrame | dict[str, np.ndarray],
+    color_rules: dict[str, Callable[[object], str]] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    stream: TextIO | None = None,
+) -> int:
+    """
+    Prints a DataFrame or a dict of NumPy columns without building row dicts.
+
+    Column widths come from vectorized string lengths, and each batch of rows
+    is formatted column by column and written with a single ``write`` call.
+
+    Parameters
+    ----------
+    data : pd.DataFrame | dict[str, np.ndarray]
+        Table given as a DataFrame or as equally long arrays keyed by column name.
+    color_rules : dict[str, Callable[[object], str]] | None
+        Optional dict mapping column names to functions returning ANSI color codes.
+    batch_size : int
+        Number of rows rendered before each single ``write`` call.
+    stream : TextIO | None
+        Destination stream; defaults to ``sys.stdout``.
+
+    Returns
+    -------
+    int
+        Number of data rows written.
+
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` is not positive or the columns differ in length.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive.")
+
+    columns: dict[str, np.ndarray] = (
+        {str(name): data[name].to_numpy() for name in data.columns}
+        if isinstance(data, pd.DataFrame)
+        else {str(name): np.asarray(values) for name, values in data.items()}
+    )
+    n_rows: int = len(next(iter(columns.values()))) if columns else 0
+    if n_rows == 0:
+        logging.warning("No data available for table.")
+        return 0
+    if any(len(values) != n_rows for values in columns.values()):
+        raise ValueError("All columns must have the same length.")
+
+    columns = {h: typed_column(values) for h, values in columns.items()}
+    headers: list[str] = list(columns)
+    widths: dict[str, int] = {
+        h: max(len(h), int(np.strings.str_len(columns[h].astype(np.str_)).max()))
+        for h in headers
+    }
+    out: TextIO = stream if stream is not None else sys.stdout
+    out.write(format_header(headers, widths))
+
+    for start in range(0, n_rows, batch_size):
+        batch: dict[str, np.ndarray] = {
+            h: values[start : start + batch_size] for h, values in columns.items()
+        }
+        out.write(format_rows(batch, widths, color_rules))
+
+    out.flush()
+    return n_rows
+
+
+def format_rows(
+    columns: dict[str, np.ndarray],
+    col_widths: dict[str, int],
+    color_rules: dict[str, Callable[[object], str]] | None = None,
+) -> str:
+    """
+    Formats equally long columns into newline-terminated table rows.
+
+    Parameters
+    ----------
+    columns : dict[str, np.ndarray]
+        Column values keyed by column name, in display order.
+    col_widths : dict[str, int]
+        Width per column name.
+    color_rules : dict[str, Callable[[object], str]] | None
+        Optional dict mapping column names to functions returning ANSI color codes.
+
+    Returns
+    -------
+    str
+        The rows, ready to be written with a single ``write`` call.
+    """
+    rules: dict[str, Callable[[object], str]] = color_rules or {}
+    lines: np.ndarray | None = None
+    for h, values in columns.items():
+        cells: np.ndarray = format_column(values, col_widths[h], rules.get(h))
+        lines = (
+            cells
+            if lines is None
+            else np.strings.add(np.strings.add(lines, " | "), cells)
+        )
+    return "\n".join(lines.tolist()) + "\n" if lines is not None else ""
+
+
+# ---------------- Live Table ----------------
+class LiveTable:
+    """
+    Terminal table that rewrites only the cells changed since the last frame.
+
+    Rows are matched across frames by the value of their ``key`` column. When
+    the row keys or columns change, or a changed value no longer fits its
+    column, the whole table is redrawn in place; otherwise only the changed
+    cells are patched using cursor-movement escape sequences.
+
+    Parameters
+    ----------
+    key : str
+        Column whose value identifies a row across frames.
+    color_rules : dict[str, Callable[[object], str]] | None
+        Optional dict mapping column names to functions returning ANSI color codes.
+    stream : TextIO | None
+        Destination stream; defaults to ``sys.stdout``.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        color_rules: dict[str, Callable[[object], str]] | None = None,
+        stream: TextIO | None = None,
+    ):
+        self.key = key
+        self._color_rules: dict[str, Callable[[object], str]] = color_rules or {}
+        self._stream: TextIO = stream if stream is not None else sys.stdout
+        self._headers: list[str] = []
+        self._widths: dict[str, int] = {}
+        self._frame: dict[object, dict[str, str | int | float]] = {}
+
+    def render(self, rows: list[dict[str, str | int | float]]) -> int:
+        """
+        Draws a new frame, writing as little as possible to the stream.
+
+        Parameters
+        ----------
+        rows : list[dict[str, str | int | float]]
+            Full list of rows for this frame.
+
+        Returns
+        -------
+        int
+            Number of cells written.
+
+        Raises
+        ------
+        ValueError
+            If two rows share the same key.
+        """
+        # Snapshot rows so callers may mutate them in place between frames
+        frame: dict[object, dict[str, str | int | float]] = {
+            row[self.key]: dict(row) for row in rows
+        }
+        if len(frame) != len(rows):
+            raise ValueError(f"Duplicate values in key column '{self.key}'.")
+        if not rows:
+            return 0
+        if list(frame) != list(self._frame) or list(rows[0]) != self._headers:
+            return self._redraw(frame, measure=True)
+
+        changed: list[tuple[int, str, str | int | float]] = [
+            (pos, h, row[h])
+            for pos, (row_key, row) in enumerate(frame.items())
+            for h in self._headers
+            if row[h] != self._frame[row_key][h]
+        ]
+        if any(len(str(value)) > self._widths[h] for _, h, value in changed):
+            for _, h, value in changed:
+                self._widths[h] = max(self._widths[h], len(str(value)))
+            return self._redraw(frame, measure=False)
+
+        self._frame = frame
+        if changed:
+            self._patch(changed)
+        return len(changed)
+
+    def _redraw(
+        self, frame: dict[object, dict[str, str | int | float]], measure: bool
+    ) -> int:
+        """Clears the previous frame, if any, and writes the whole table."""
+        rows: list[dict[str, str | int | float]] = list(frame.values())
+        clear: str = (
+            f"{Cursor.up(len(self._frame) + 2)}\r{Cursor.CLEAR_DOWN}"
+            if self._frame
+            else ""
+        )
+        if measure:
+            self._headers = list(rows[0])
+            self._widths = measure_col_widths(self._headers, rows)
+        self._frame = frame
+
+        lines: list[str] = [
+            " | ".join(
+                format_cell(row[h], self._widths[h], self._color_rules.get(h))
+                for h in self._headers
+            )
+            for row in rows
+        ]
+        self._stream.write(
+            clear + format_header(self._headers, self._widths) + "\n".join(lines) + "\n"
+        )
+        self._stream.flush()
+        return len(rows) * len(self._headers)
+
+    def _patch(self, changed: list[tuple[int, str, str | int | float]]) -> None:
+        """Rewrites the given cells in place, leaving the cursor below the table."""
+        offsets: dict[str, int] = {}
+        position: int = 0
+        for h in self._headers:
+            offsets[h] = position
+            position += self._widths[h] + 3  # width plus " | " separator
+
+        parts: list[str] = []
+        for pos, h, value in changed:
+            lines_up: int = len(self._frame) - pos
+            parts.append(
+                Cursor.up(lines_up)
+                + Cursor.column(offsets[h] + 1)
+                + format_cell(value, self._widths[h], self._color_rules.get(h))
+                + Cursor.down(lines_up)
+            )
+        self._stream.write("".join(parts) + "\r")
+        self._stream.flush()
+
+
 # ---------------- Color Rules ----------------
 def score_color(value: float) -> str:
     """Returns color code based on score."""
@@ -142,6 +795,41 @@ def age_color(value: int) -> str:
     return Colors.ENDC
 
 
+SCORE_COLOR_RULE = ColorRule(
+    [(">=", 90, Colors.OKGREEN), (">=", 70, Colors.WARNING)], default=Colors.FAIL
+)
+AGE_COLOR_RULE = ColorRule([("<", 25, Colors.OKCYAN), (">", 35, Colors.WARNING)])
+
+
+def benchmark_color_rules(n_rows: int = 1_000_000) -> dict[str, float]:
+    """
+    Times per-cell callable color rules against their compiled equivalents.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of random scores to color.
+
+    Returns
+    -------
+    dict[str, float]
+        Elapsed seconds for the ``callable`` and ``compiled`` paths.
+    """
+    scores: np.ndarray = np.random.default_rng(0).uniform(0, 100, size=n_rows)
+
+    start: float = time.perf_counter()
+    slow: list[str] = [score_color(value) for value in scores.tolist()]
+    callable_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast: np.ndarray = SCORE_COLOR_RULE.apply(scores)
+    compiled_time: float = time.perf_counter() - start
+
+    if slow != fast.tolist():
+        raise RuntimeError("Compiled color rule disagrees with score_color.")
+    return {"callable": callable_time, "compiled": compiled_time}
+
+
 # ---------------- Main ----------------
 def main() -> None:
     """
@@ -164,6 +852,54 @@ def main() -> None:
     print_dynamic_table(data, color_rules)
     print()
 
+    print_colored("=== Cached Cells (repeated renders) ===", Colors.HEADER)
+    cached_formatter: CellFormatter = cached_format_cell(maxsize=64)
+    for _ in range(3):
+        print_dynamic_table(data, color_rules, cached_formatter)
+    print()
+    logging.info("Cell cache after 3 renders: %s", cached_formatter.cache_info())
+
+    print_colored("=== Streaming Table (generator input) ===", Colors.HEADER)
+    generated_rows = (
+        {"Name": f"User{i:02d}", "Age": 20 + i * 3, "Score": 60.0 + i * 6.5}
+        for i in range(6)
+    )
+    rows_written: int = print_dynamic_table_stream(
+        generated_rows, color_rules, batch_size=4
+    )
+    print()
+    logging.info("Streamed %d rows in batches.", rows_written)
+
+    print_colored("=== Columnar Table (pandas DataFrame) ===", Colors.HEADER)
+    print_columnar_table(pd.DataFrame(data), color_rules)
+    print()
+
+    print_colored("=== Live Table (incremental refresh) ===", Colors.HEADER)
+    live_table = LiveTable(key="Name", color_rules=color_rules)
+    cells_written: list[int] = [live_table.render(data)]
+    for tick in range(1, 4):
+        time.sleep(0.3)
+        data[tick]["Score"] = round(data[tick]["Score"] + 5.0, 1)
+        cells_written.append(live_table.render(data))
+    print()
+    # Logged after the loop so log lines do not shift the live frame
+    logging.info("Live table cells written per tick: %s", cells_written)
+
+    print_colored("=== Compiled Color Rules ===", Colors.HEADER)
+    compiled_rules: dict[str, Callable[[object], str]] = {
+        "Score": SCORE_COLOR_RULE,
+        "Age": AGE_COLOR_RULE,
+    }
+    print_columnar_table(pd.DataFrame(data), compiled_rules)
+    timings: dict[str, float] = benchmark_color_rules(200_000)
+    logging.info(
+        "Color rules on 200k cells: callable %.4fs, compiled %.4fs (%.1fx faster).",
+        timings["callable"],
+        timings["compiled"],
+        timings["callable"] / timings["compiled"],
+    )
+    print()
+
     logging.info("Dynamic table printed successfully.")
 
 
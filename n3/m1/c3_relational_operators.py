@@ -16,8 +16,11 @@ Operators:
 # -------------------------------------------
 # 1. Basic Comparisons
 # -------------------------------------------
+import time
 from functools import total_ordering
 
+import numpy as np
+
 a, b = 10, 20
 print("1) Basic Comparisons")
 print(f"{a} == {b} ->", a == b)  # False: 10 is not equal to 20
@@ -135,3 +138,278 @@ p2 = Person("Bob", 25)
 print(f"{p1} > {p2} ->", p1 > p2)  # True, because 30 > 25
 print(f"{p1} >= {p2} ->", p1 >= p2)  # True, generated automatically
 print(f"{p1} == {p2} ->", p1 == p2)  # False
+print()
+
+# -------------------------------------------
+# 7. Packed Version Arrays for Bulk Sorting
+# -------------------------------------------
+print("7) Packed Version Arrays")
+
+
+class VersionArray:
+    """
+    A column of versions packed into one sortable int64 key per version:
+    key = major << 32 | minor. Comparing two keys gives the same answer as
+    comparing (major, minor) tuples, so sorting, min/max and binary search
+    run in NumPy instead of calling Version.__lt__ for every pair.
+    """
+
+    SHIFT = 32
+    LIMIT = 2**31  # major must stay below it (sign bit); minor below 2**SHIFT
+
+    def __init__(self, majors, minors):
+        majors = np.asarray(majors, dtype=np.int64)
+        minors = np.asarray(minors, dtype=np.int64)
+        if majors.shape != minors.shape:
+            raise ValueError("majors and minors must have the same shape")
+        if (majors < 0).any() or (majors >= self.LIMIT).any():
+            raise ValueError(f"major must be in [0, {self.LIMIT})")
+        if (minors < 0).any() or (minors >= 2**self.SHIFT).any():
+            raise ValueError(f"minor must be in [0, {2**self.SHIFT})")
+        self.keys = (majors << self.SHIFT) | minors
+
+    @classmethod
+    def from_versions(cls, version_list):
+        majors = [v.major for v in version_list]
+        minors = [v.minor for v in version_list]
+        return cls(majors, minors)
+
+    @classmethod
+    def _from_keys(cls, keys):
+        array = cls.__new__(cls)
+        array.keys = keys
+        return array
+
+    @classmethod
+    def pack(cls, version):
+        # Scalar key of a single Version, for comparisons and searches
+        return (version.major << cls.SHIFT) | version.minor
+
+    @property
+    def majors(self):
+        return self.keys >> self.SHIFT
+
+    @property
+    def minors(self):
+        return self.keys & (2**self.SHIFT - 1)
+
+    def to_versions(self):
+        return [
+            Version(int(k) >> self.SHIFT, int(k) & (2**self.SHIFT - 1))
+            for k in self.keys
+        ]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        # A single position gives a Version; slices, masks and index arrays
+        # give a new VersionArray
+        selected = self.keys[index]
+        if np.ndim(selected) == 0:
+            return Version(
+                int(selected) >> self.SHIFT, int(selected) & (2**self.SHIFT - 1)
+            )
+        return self._from_keys(selected)
+
+    def _other_keys(self, other):
+        return other.keys if isinstance(other, VersionArray) else self.pack(other)
+
+    # Vectorized comparisons return boolean arrays, like NumPy arrays do
+    def __eq__(self, other):
+        return self.keys == self._other_keys(other)
+
+    def __ne__(self, other):
+        return self.keys != self._other_keys(other)
+
+    def __lt__(self, other):
+        return self.keys < self._other_keys(other)
+
+    def __le__(self, other):
+        return self.keys <= self._other_keys(other)
+
+    def __gt__(self, other):
+        return self.keys > self._other_keys(other)
+
+    def __ge__(self, other):
+        return self.keys >= self._other_keys(other)
+
+    __hash__ = None  # element-wise __eq__ makes the array unhashable
+
+    def argsort(self):
+        return np.argsort(self.keys, kind="stable")
+
+    def sort(self):
+        return self._from_keys(np.sort(self.keys, kind="stable"))
+
+    def min(self):
+        return self[int(np.argmin(self.keys))]
+
+    def max(self):
+        return self[int(np.argmax(self.keys))]
+
+    def searchsorted(self, version, side="left"):
+        # Insertion point of a Version in an already sorted VersionArray
+        return int(np.searchsorted(self.keys, self.pack(version), side=side))
+
+    def __repr__(self):
+        return f"VersionArray({self.to_versions()})"
+
+
+packed = VersionArray.from_versions(versions)
+print("Packed:", packed)
+print("Sorted:", packed.sort())  # Same order as sorted(versions)
+print("packed >= Version(1, 5) ->", packed >= Version(1, 5))  # Element-wise
+print("Min / Max:", packed.min(), "/", packed.max())
+print("Insert Version(1, 8) at ->", packed.sort().searchsorted(Version(1, 8)))
+print()
+
+# Bulk sorting: Python-level __lt__ vs packed integer keys
+rng = np.random.default_rng(42)
+N_VERSIONS = 100_000
+inventory = [
+    Version(int(ma), int(mi))
+    for ma, mi in zip(rng.integers(0, 20, N_VERSIONS), rng.integers(0, 50, N_VERSIONS))
+]
+
+start = time.perf_counter()
+sorted_objects = sorted(inventory)
+objects_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+packed_inventory = VersionArray.from_versions(inventory)
+pack_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+sorted_inventory = packed_inventory.sort()
+sort_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+sorted_packed = sorted_inventory.to_versions()
+unpack_seconds = time.perf_counter() - start
+
+print(f"sorted() on {N_VERSIONS:,} Version objects: {objects_seconds:.4f}s")
+print(
+    f"VersionArray: pack {pack_seconds:.4f}s + sort {sort_seconds:.4f}s"
+    f" + unpack {unpack_seconds:.4f}s"
+)
+print("Same order ->", sorted_objects == sorted_packed)
+print()
+
+# -------------------------------------------
+# 8. Fast Comparisons with Cached Sort Keys
+# -------------------------------------------
+print("8) Fast Comparisons with Cached Sort Keys")
+
+
+class FastPerson:
+    """
+    Same ordering as Person (by age), but faster:
+    - __slots__ removes the per-instance __dict__
+    - the sort key is cached in a slot and kept in sync by the age setter
+    - all six rich comparisons are defined directly, so >, >= and <= do not
+      go through the extra Python calls generated by @total_ordering
+    - foreign types get NotImplemented, like the comparisons of built-ins
+    - unhashable, because __eq__ depends on the mutable age
+    """
+
+    __slots__ = ("name", "_age", "sort_key")
+
+    def __init__(self, name: str, age: int):
+        self.name = name
+        self.age = age
+
+    @property
+    def age(self) -> int:
+        return self._age
+
+    @age.setter
+    def age(self, value: int):
+        self._age = value
+        self.sort_key = value  # Cached key used by every comparison
+
+    def __eq__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key == other.sort_key
+
+    def __ne__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key != other.sort_key
+
+    def __lt__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other):
+        if not isinstance(other, FastPerson):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
+
+    # Equality follows the mutable age, so instances must not be hashable:
+    # a hash taken before `p.age = ...` would strand p in its set/dict bucket
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.name}({self.age})"
+
+
+def rank_people(people, descending=False):
+    # Extract the keys once and let NumPy order them; a stable sort keeps
+    # people with the same age in their original order, like sorted()
+    keys = np.fromiter((p.sort_key for p in people), dtype=np.int64, count=len(people))
+    order = np.argsort(-keys if descending else keys, kind="stable")
+    return [people[i] for i in order]
+
+
+fp1 = FastPerson("Alice", 30)
+fp2 = FastPerson("Bob", 25)
+print(f"{fp1} >= {fp2} ->", fp1 >= fp2)  # True, defined directly
+print("Ranking (oldest first):", rank_people([fp2, fp1, FastPerson("Carla", 40)], True))
+print("Distinct ages ->", len({p.sort_key for p in (fp1, fp2, FastPerson("Dave", 30))}))
+print()
+
+# Benchmark: @total_ordering vs direct comparisons vs NumPy ranking
+N_PEOPLE = 200_000
+ages_sample = rng.integers(18, 90, N_PEOPLE).tolist()
+slow_people = [Person(f"P{i}", age) for i, age in enumerate(ages_sample)]
+fast_people = [FastPerson(f"P{i}", age) for i, age in enumerate(ages_sample)]
+slow_pivot, fast_pivot = Person("Pivot", 50), FastPerson("Pivot", 50)
+
+start = time.perf_counter()
+slow_count = sum(p >= slow_pivot for p in slow_people)
+slow_compare_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+fast_count = sum(p >= fast_pivot for p in fast_people)
+fast_compare_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+sorted_slow = sorted(slow_people)
+slow_sort_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+ranked_fast = rank_people(fast_people)
+fast_sort_seconds = time.perf_counter() - start
+
+print(f"{N_PEOPLE:,} '>=' checks: total_ordering {slow_compare_seconds:.4f}s")
+print(f"{N_PEOPLE:,} '>=' checks: FastPerson     {fast_compare_seconds:.4f}s")
+print(f"Sorting: sorted(Person) {slow_sort_seconds:.4f}s")
+print(f"Sorting: rank_people    {fast_sort_seconds:.4f}s")
+print(
+    "Same results ->",
+    slow_count == fast_count
+    and [p.name for p in sorted_slow] == [p.name for p in ranked_fast],
+)
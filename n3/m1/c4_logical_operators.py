@@ -12,8 +12,18 @@ Key Concepts:
     - Truthy and Falsy Values
     - Short-Circuit Evaluation
     - Custom Boolean Logic with __bool__
+    - Self-optimizing predicate composition (row-wise and vectorized)
+    - Connection pooling with truthiness-based health checks
 """
 
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
 # -------------------------------------------
 # 1. Basic Logical Operations
 # -------------------------------------------
@@ -131,3 +141,441 @@ print("Selected user ->", FINAL_USER)
 data = {"value": 10}
 result = data.get("value") and (data["value"] * 2)
 print("Computed result ->", result)
+print()
+
+# -------------------------------------------
+# 8. Composable, Self-Optimizing Predicates
+# -------------------------------------------
+print("8) Composable, Self-Optimizing Predicates")
+
+# Short-circuiting pays off most when the check that decides the result
+# runs first. With many predicates of different cost and selectivity, the
+# best order is not obvious, so the composite predicates below measure
+# each child at runtime and reorder themselves:
+#   AND -> cheapest per "False" first: cost / (1 - pass rate)
+#   OR  -> cheapest per "True" first : cost / pass rate
+# Row-wise and vectorized costs differ by orders of magnitude, so each mode
+# keeps its own profile and is reordered from its own numbers only.
+
+
+class Profile:
+    """Calls, passes and time of one evaluation mode (row-wise or vectorized)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.passes = 0
+        self.seconds = 0.0
+
+    def record(self, seconds: float, calls: int, passes: int) -> None:
+        """Adds one measured evaluation of `calls` items."""
+        self.seconds += seconds
+        self.calls += calls
+        self.passes += passes
+
+    @property
+    def cost(self) -> float:
+        """Average seconds per evaluated item."""
+        return self.seconds / self.calls if self.calls else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        """Share of passing items; unknown predicates are assumed at 0.5."""
+        return self.passes / self.calls if self.calls else 0.5
+
+
+class Predicate(ABC):
+    """
+    Base class of a predicate tree. Every evaluation is profiled (calls,
+    passes, time), one item at a time (__call__, into row_stats) and for
+    whole columns (mask, into mask_stats). Combine predicates with &, | and ~.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.row_stats = Profile()
+        self.mask_stats = Profile()
+
+    def __call__(self, item) -> bool:
+        began = time.perf_counter()
+        outcome = self._evaluate(item)
+        self.row_stats.record(time.perf_counter() - began, 1, outcome)
+        return outcome
+
+    def mask(self, columns) -> np.ndarray:
+        # Vectorized mode: columns is a dict of NumPy arrays or a DataFrame
+        began = time.perf_counter()
+        outcome = np.asarray(self._mask(columns), dtype=bool)
+        self.mask_stats.record(
+            time.perf_counter() - began, outcome.size, int(outcome.sum())
+        )
+        return outcome
+
+    @abstractmethod
+    def _evaluate(self, item) -> bool:
+        """Row-wise outcome for one item; profiled by __call__."""
+
+    @abstractmethod
+    def _mask(self, columns) -> np.ndarray:
+        """Vectorized outcome for whole columns; profiled by mask()."""
+
+    @property
+    def cost(self) -> float:
+        # Average seconds per item, row-wise
+        return self.row_stats.cost
+
+    @property
+    def pass_rate(self) -> float:
+        # Share of items passing, row-wise
+        return self.row_stats.pass_rate
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+    def __or__(self, other):
+        return AnyOf(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    def __repr__(self):
+        return self.name
+
+
+class Condition(Predicate):
+    """Leaf predicate: a row-wise function and an optional vectorized twin."""
+
+    def __init__(self, name: str, func, vectorized=None):
+        super().__init__(name)
+        self.func = func
+        self.vectorized = vectorized
+
+    def _evaluate(self, item) -> bool:
+        return bool(self.func(item))
+
+    def _mask(self, columns) -> np.ndarray:
+        if self.vectorized is None:
+            raise ValueError(f"Condition '{self.name}' has no vectorized form")
+        return self.vectorized(columns)
+
+
+class Not(Predicate):
+    def __init__(self, predicate: Predicate):
+        super().__init__(f"NOT {predicate.name}")
+        self.predicate = predicate
+
+    def _evaluate(self, item) -> bool:
+        return not self.predicate(item)
+
+    def _mask(self, columns) -> np.ndarray:
+        return ~self.predicate.mask(columns)
+
+
+class AllOf(Predicate):
+    """AND of several predicates, reordered every `reorder_every` items."""
+
+    JOINER = "AND"
+
+    def __init__(self, *predicates: Predicate, reorder_every: int = 1_000):
+        if reorder_every < 1:
+            raise ValueError("reorder_every must be at least 1")
+        # Flatten a & b & c into one node instead of nesting ((a & b) & c)
+        flat = []
+        for predicate in predicates:
+            if type(predicate) is type(self):
+                flat.extend(predicate.predicates)
+            else:
+                flat.append(predicate)
+        super().__init__(f"({f' {self.JOINER} '.join(p.name for p in flat)})")
+        self.predicates = flat
+        self.reorder_every = reorder_every
+
+    def _score(self, stats: Profile) -> float:
+        # Expected cost of reaching a decisive (False) result
+        return stats.cost / max(1.0 - stats.pass_rate, 1e-9)
+
+    def reorder(self, vectorized: bool = False) -> None:
+        # Sort by the profile of the mode about to run
+        if vectorized:
+            self.predicates.sort(key=lambda p: self._score(p.mask_stats))
+        else:
+            self.predicates.sort(key=lambda p: self._score(p.row_stats))
+
+    def _evaluate(self, item) -> bool:
+        calls = self.row_stats.calls
+        if calls and calls % self.reorder_every == 0:
+            self.reorder()
+        return all(p(item) for p in self.predicates)  # Short-circuits
+
+    def _mask(self, columns) -> np.ndarray:
+        self.reorder(vectorized=True)
+        combined = None
+        for predicate in self.predicates:
+            current = predicate.mask(columns)
+            combined = current if combined is None else combined & current
+            if not combined.any():
+                break  # Every row already failed: skip the remaining columns
+        return combined
+
+
+class AnyOf(AllOf):
+    """OR of several predicates, reordered every `reorder_every` items."""
+
+    JOINER = "OR"
+
+    def _score(self, stats: Profile) -> float:
+        # Expected cost of reaching a decisive (True) result
+        return stats.cost / max(stats.pass_rate, 1e-9)
+
+    def _evaluate(self, item) -> bool:
+        calls = self.row_stats.calls
+        if calls and calls % self.reorder_every == 0:
+            self.reorder()
+        return any(p(item) for p in self.predicates)  # Short-circuits
+
+    def _mask(self, columns) -> np.ndarray:
+        self.reorder(vectorized=True)
+        combined = None
+        for predicate in self.predicates:
+            current = predicate.mask(columns)
+            combined = current if combined is None else combined | current
+            if combined.all():
+                break  # Every row already passed: skip the remaining columns
+        return combined
+
+
+def slow_credit_check(row) -> bool:
+    # Stand-in for an expensive check (remote lookup, heavy parsing, ...)
+    sum(range(1_000))
+    return row["income"] > 30_000
+
+
+rng = np.random.default_rng(7)
+N_ROWS = 20_000
+table_columns = {
+    "age": rng.integers(10, 80, N_ROWS),
+    "income": rng.integers(5_000, 120_000, N_ROWS),
+    "active": rng.random(N_ROWS) < 0.1,  # Rarely true: very selective
+}
+rows = [dict(zip(table_columns, values)) for values in zip(*table_columns.values())]
+
+
+def make_conditions() -> tuple[Condition, Condition, Condition]:
+    """Fresh leaves on every call: profiling stats live on the instances."""
+    return (
+        Condition("credit", slow_credit_check, lambda c: c["income"] > 30_000),
+        Condition("adult", lambda r: r["age"] >= 18, lambda c: c["age"] >= 18),
+        Condition("active", lambda r: r["active"], lambda c: c["active"]),
+    )
+
+
+credit, adult, active = make_conditions()
+eligible = credit & adult & active  # Deliberately written in the worst order
+
+# Baseline: equivalent but separate leaves, never reordered (plain
+# left-to-right short-circuit), so the learning pass below starts cold
+fixed = AllOf(*make_conditions(), reorder_every=N_ROWS + 1)
+start = time.perf_counter()
+fixed_pass = sum(fixed(row) for row in rows)
+fixed_seconds = time.perf_counter() - start
+
+print("Initial order :", eligible.predicates)
+start = time.perf_counter()
+first_pass = sum(eligible(row) for row in rows)
+first_seconds = time.perf_counter() - start
+print("Learned order :", eligible.predicates)
+
+start = time.perf_counter()
+second_pass = sum(eligible(row) for row in rows)
+second_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+vectorized_pass = int(eligible.mask(table_columns).sum())
+vectorized_seconds = time.perf_counter() - start
+
+print(f"Row-wise, fixed written order  : {fixed_pass} rows in {fixed_seconds:.4f}s")
+print(f"Row-wise, first pass (learning): {first_pass} rows in {first_seconds:.4f}s")
+print(f"Row-wise, learned order        : {second_pass} rows in {second_seconds:.4f}s")
+print(
+    f"Vectorized masks               : {vectorized_pass} rows in {vectorized_seconds:.4f}s"
+)
+for leaf in (credit, adult, active):
+    print(
+        f"  {leaf.name:<6} pass rate {leaf.pass_rate:.2f}, "
+        f"{leaf.cost * 1e6:.2f} us/item row-wise, "
+        f"{leaf.mask_stats.cost * 1e9:.2f} ns/item vectorized"
+    )
+print()
+
+# -------------------------------------------
+# 9. Connection Pool with Truthiness Health Checks
+# -------------------------------------------
+print("9) Connection Pool with Truthiness Health Checks")
+
+# `conn1 or conn2` picks the first truthy (open) connection. A pool applies
+# the same rule at scale: it only hands out connections that are truthy,
+# discards the falsy ones, and evicts connections idle for too long.
+
+
+class ConnectionPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe, bounded pool of Connection-like objects.
+
+    Any factory returning objects whose truthiness means "healthy" works,
+    so the pool can be exercised locally with plain Connection instances.
+    """
+
+    def __init__(self, factory, max_size: int = 4, max_idle: float = 30.0):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._factory = factory
+        self.max_size = max_size
+        self.max_idle = max_idle  # Seconds before an idle connection is stale
+        self._idle = deque()  # (connection, released_at), most recent on the right
+        self._size = 0  # Live connections: idle + checked out + being created
+        # Checked-out connections by id(): works for unhashable connection types
+        self._in_use = {}
+        self._cond = threading.Condition()
+        self.metrics = {
+            "checkouts": 0,
+            "created": 0,
+            "evicted": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+
+    def acquire(self, timeout: float | None = None):
+        """Checks out a healthy connection, waiting up to `timeout` seconds."""
+        began = time.monotonic()
+        deadline = None if timeout is None else began + timeout
+        with self._cond:
+            while True:
+                conn = self._take_idle()
+                if conn:
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # Reserve the slot, connect outside the lock
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No connection available in the pool")
+                self._cond.wait(remaining)
+
+        if not conn:
+            conn = self._connect()
+        waited = time.monotonic() - began
+        with self._cond:
+            self._in_use[id(conn)] = conn
+            self.metrics["checkouts"] += 1
+            self.metrics["total_wait"] += waited
+            self.metrics["max_wait"] = max(self.metrics["max_wait"], waited)
+        return conn
+
+    def release(self, conn) -> None:
+        """
+        Returns a connection; falsy (closed) connections are discarded.
+        Raises ValueError for a connection that is not checked out from this
+        pool (never acquired, or already released).
+        """
+        with self._cond:
+            if self._in_use.pop(id(conn), None) is not conn:
+                raise ValueError(f"{conn!r} is not checked out from this pool")
+            if conn:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._size -= 1
+                self.metrics["evicted"] += 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout: float | None = None):
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @property
+    def utilization(self) -> float:
+        # Share of the pool capacity currently checked out
+        with self._cond:
+            return (self._size - len(self._idle)) / self.max_size
+
+    def stats(self) -> dict:
+        with self._cond:
+            checkouts = self.metrics["checkouts"]
+            return {
+                **self.metrics,
+                "avg_wait": (
+                    self.metrics["total_wait"] / checkouts if checkouts else 0.0
+                ),
+                "size": self._size,
+                "idle": len(self._idle),
+            }
+
+    def _take_idle(self):
+        # Called with the lock held. Oldest entries (left) go stale first;
+        # the most recently used healthy connection (right) is reused.
+        now = time.monotonic()
+        while self._idle and now - self._idle[0][1] > self.max_idle:
+            self._idle.popleft()
+            self._size -= 1
+            self.metrics["evicted"] += 1
+        while self._idle:
+            conn, _ = self._idle.pop()
+            if conn:
+                return conn
+            self._size -= 1  # Closed while idle: falsy, so never handed out
+            self.metrics["evicted"] += 1
+        return None
+
+    def _connect(self):
+        try:
+            conn = self._factory()
+            if not conn:
+                raise ConnectionError("Factory returned a closed connection")
+        except Exception:
+            with self._cond:
+                self._size -= 1  # Give the reserved slot back
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.metrics["created"] += 1
+        return conn
+
+
+pool = ConnectionPool(lambda: Connection(is_open=True), max_size=3, max_idle=5.0)
+
+
+def worker(worker_id: int) -> None:
+    for i in range(20):
+        with pool.connection(timeout=2.0) as conn:
+            time.sleep(0.001)  # Simulated query
+            if (worker_id + i) % 15 == 0:
+                conn.open = False  # Connection dropped mid-use: evicted on release
+
+
+threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+pool_stats = pool.stats()
+print(
+    f"Checkouts: {pool_stats['checkouts']}, created: {pool_stats['created']}, "
+    f"evicted: {pool_stats['evicted']}, live: {pool_stats['size']}"
+)
+print(
+    f"Wait avg: {pool_stats['avg_wait'] * 1000:.2f} ms, "
+    f"max: {pool_stats['max_wait'] * 1000:.2f} ms, "
+    f"utilization now: {pool.utilization:.0%}"
+)
+
+# Releasing twice would put one connection in the idle queue twice and hand
+# it to two callers at once, so the pool rejects it
+borrowed = pool.acquire()
+pool.release(borrowed)
+try:
+    pool.release(borrowed)
+except ValueError as error:
+    print("Double release rejected:", error)
@@ -23,8 +23,16 @@ Key Concepts:
     - Augmented assignment is not just syntactic sugar
     - Mutable vs. immutable objects
     - Operator overloading (__iadd__, __imul__, etc.)
+    - Contention-free augmented assignment from many threads
+    - In-place accumulation: a growable NumPy buffer (+=) and dict merges (|=)
 """
 
+import threading
+import time
+import weakref
+
+import numpy as np
+
 # -------------------------------------------
 # 1. Simple Assignment
 # -------------------------------------------
@@ -155,3 +163,254 @@ data = {"a": 1}
 print("Before |= ->", data, "| id:", id(data))
 data |= {"b": 2}  # Dictionary merge (Python 3.9+)
 print("After |=  ->", data, "| id:", id(data))  # Same id because dict is mutable
+print()
+
+# -------------------------------------------
+# 10. Sharded Counters for Multithreaded +=
+# -------------------------------------------
+print("10) Sharded Counters for Multithreaded +=")
+
+# The Counter above prints on every call and is not thread-safe. The usual
+# fix, a lock around `self.value += other`, makes every thread queue on the
+# same lock. A sharded counter gives each thread its own slot instead: +=
+# only touches the caller's slot, and the slots are summed when read.
+
+
+class LockedCounter:
+    """Baseline: one shared value guarded by one lock."""
+
+    def __init__(self, value: int = 0):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def __iadd__(self, other):
+        with self._lock:
+            self._value += other
+        return self
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+    def __repr__(self):
+        return f"LockedCounter({self.value})"
+
+
+def _call_if_alive(method_ref, *args):
+    """Calls the method behind a WeakMethod unless its object is gone."""
+    method = method_ref()
+    if method is not None:
+        method(*args)
+
+
+class _ThreadExit:  # pylint: disable=too-few-public-methods
+    """Sentinel kept only in a thread's threading.local; dies with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class ShardedCounter:
+    """
+    Event counter with one slot per live thread. Each slot is written only
+    by its own thread, so += needs no lock; the lock is taken once per thread
+    (to register its slot), when reading the total, and when a thread ends:
+    its slot is then folded into the base value and dropped, so thread churn
+    (e.g. executor threads) does not grow the counter or its read cost.
+    """
+
+    def __init__(self, value: int = 0):
+        self._base = value
+        self._slots = {}  # id(slot) -> single-item list, one per live thread
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __iadd__(self, other):
+        try:
+            slot = self._local.slot
+        except AttributeError:
+            slot = self._register()
+        slot[0] += other
+        return self
+
+    def _register(self):
+        slot = self._local.slot = [0]
+        sentinel = self._local.sentinel = _ThreadExit()
+        with self._lock:
+            self._slots[id(slot)] = slot
+        # threading.local releases the sentinel when the thread exits; the
+        # counter is referenced weakly so the finalizer does not keep it alive
+        weakref.finalize(sentinel, _call_if_alive, weakref.WeakMethod(self._fold), slot)
+        return slot
+
+    def _fold(self, slot):
+        with self._lock:
+            del self._slots[id(slot)]
+            self._base += slot[0]
+
+    @property
+    def live_slots(self) -> int:
+        """Number of per-thread slots not yet folded into the base value."""
+        with self._lock:
+            return len(self._slots)
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._base + sum(slot[0] for slot in self._slots.values())
+
+    def __repr__(self):
+        return f"ShardedCounter({self.value})"
+
+
+def count_events(event_counter, n_threads: int, increments: int) -> float:
+    def work():
+        # += rebinds its target, so bind a local name to the shared counter
+        shared = event_counter
+        for _ in range(increments):
+            shared += 1
+
+    threads = [threading.Thread(target=work) for _ in range(n_threads)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - began
+
+
+N_THREADS, INCREMENTS = 8, 100_000
+locked_counter, sharded_counter = LockedCounter(), ShardedCounter()
+locked_seconds = count_events(locked_counter, N_THREADS, INCREMENTS)
+sharded_seconds = count_events(sharded_counter, N_THREADS, INCREMENTS)
+TOTAL_INCREMENTS = N_THREADS * INCREMENTS
+
+print(f"{N_THREADS} threads x {INCREMENTS:,} increments:")
+print(
+    f"LockedCounter : {locked_counter.value:,} in {locked_seconds:.3f}s"
+    f" ({TOTAL_INCREMENTS / locked_seconds / 1e6:.2f} M ops/s)"
+)
+print(
+    f"ShardedCounter: {sharded_counter.value:,} in {sharded_seconds:.3f}s"
+    f" ({TOTAL_INCREMENTS / sharded_seconds / 1e6:.2f} M ops/s)"
+)
+# Thread churn: slots of finished threads are folded into the base value
+for _ in range(50):
+    count_events(sharded_counter, 4, 10)
+print(
+    f"After 200 short-lived threads: {sharded_counter.value:,}"
+    f" ({sharded_counter.live_slots} live slots)"
+)
+print()
+
+# -------------------------------------------
+# 11. In-Place Accumulation Buffers
+# -------------------------------------------
+print("11) In-Place Accumulation Buffers")
+
+# Sections 3 and 9 showed that `lst += [...]` and `data |= {...}` mutate in
+# place. Written as `arr = np.concatenate([arr, chunk])` or `d = d | chunk`
+# instead, every step copies everything accumulated so far (O(n^2) total).
+# For dicts, plain `d |= chunk` is already the fix: CPython dicts grow
+# geometrically, so merging in place keeps the total work linear. NumPy
+# arrays cannot grow in place, so the accumulator below adds that growth.
+
+
+class NumericAccumulator:
+    """
+    Array-backed numeric list. Capacity grows geometrically, so += of a
+    scalar or a whole chunk is amortized O(1) per value, and to_numpy()
+    returns a view of the filled part: no final copy or boxed-int conversion.
+    """
+
+    def __init__(self, dtype=np.float64, chunk_size: int = 1_024):
+        self._data = np.empty(chunk_size, dtype=dtype)
+        self._size = 0
+
+    def __iadd__(self, values):
+        if np.isscalar(values):
+            self._reserve(self._size + 1)
+            self._data[self._size] = values
+            self._size += 1
+            return self
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        end = self._size + len(values)
+        self._reserve(end)
+        self._data[self._size : end] = values
+        self._size = end
+        return self
+
+    def _reserve(self, needed: int) -> None:
+        if needed > len(self._data):
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+
+    def __len__(self):
+        return self._size
+
+    def to_numpy(self) -> np.ndarray:
+        # Zero-copy view; it keeps its values even if the buffer grows later
+        return self._data[: self._size]
+
+    def __repr__(self):
+        return f"NumericAccumulator(size={self._size}, capacity={len(self._data)})"
+
+
+acc = NumericAccumulator(dtype=np.int64, chunk_size=4)
+acc += 1
+acc += [2, 3, 4, 5]
+print("Accumulator:", acc, "->", acc.to_numpy())
+print()
+
+# Benchmark: copying accumulation vs in-place accumulation
+N_CHUNKS, CHUNK_LEN = 500, 2_000
+chunks = [np.arange(CHUNK_LEN, dtype=np.float64) + i for i in range(N_CHUNKS)]
+
+start = time.perf_counter()
+concatenated = np.empty(0)
+for chunk in chunks:
+    concatenated = np.concatenate([concatenated, chunk])  # Copies every step
+concat_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+values_list = []
+for chunk in chunks:
+    values_list += chunk.tolist()  # In place, but boxes every value
+from_list = np.array(values_list)
+list_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+accumulator = NumericAccumulator()
+for chunk in chunks:
+    accumulator += chunk
+from_accumulator = accumulator.to_numpy()
+acc_seconds = time.perf_counter() - start
+
+print(f"{N_CHUNKS} chunks x {CHUNK_LEN:,} values:")
+print(f"arr = concatenate(...)  : {concat_seconds:.4f}s")
+print(f"list += + np.array()    : {list_seconds:.4f}s")
+print(f"NumericAccumulator +=   : {acc_seconds:.4f}s")
+print(
+    "Same values ->",
+    np.array_equal(concatenated, from_list)
+    and np.array_equal(from_list, from_accumulator),
+)
+
+dict_chunks = [{f"k{i}_{j}": j for j in range(200)} for i in range(300)]
+
+start = time.perf_counter()
+merged = {}
+for part in dict_chunks:
+    merged = merged | part  # New dict every step
+copy_merge_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+merged_in_place = {}
+for part in dict_chunks:
+    merged_in_place |= part  # Same dict, extended in place
+in_place_seconds = time.perf_counter() - start
+
+print(f"d = d | chunk (300 chunks): {copy_merge_seconds:.4f}s")
+print(f"d |= chunk                : {in_place_seconds:.4f}s")
+print("Same dict ->", merged == merged_in_place)
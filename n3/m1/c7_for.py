@@ -14,8 +14,15 @@ Key Concepts:
     - Looping over pandas DataFrames
     - List/Dict comprehensions
     - Vectorized alternatives for performance
+    - Batched, typed row access instead of iterrows()
+    - Streaming, mergeable statistics that skip missing values
 """
 
+import math
+import time
+from collections import namedtuple
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
@@ -183,6 +190,245 @@ vectorized_mean = large_array.mean()
 
 # Manual mean (much slower in Python)
 # manual_mean = sum(large_array) / len(large_array)  # Not recommended
+# Measured at several sizes by: python c7_for_benchmarks.py --output results.json
 
 print("Vectorized mean:", vectorized_mean)
 print("Note: Avoid Python for-loops for large arrays; prefer NumPy/pandas.")
+print()
+
+# -------------------------------------------
+# 13. Batched, Typed Row Access
+# -------------------------------------------
+print("13) Batched, Typed Row Access")
+
+# iterrows() builds a pandas Series (and boxes every value) for each row;
+# itertuples() builds one namedtuple per row. iter_column_blocks converts each
+# column to NumPy once and yields fixed-size blocks of slices (views, no copy),
+# so loop bodies can stay vectorized. Where per-row code is unavoidable,
+# iter_rows() yields lightweight rows with row.name / row.age access.
+
+BLOCK_SIZE = 65_536  # rows per block
+
+
+def iter_column_blocks(frame, columns=None, block_size=BLOCK_SIZE):
+    """Yields {column: ndarray} blocks of at most `block_size` rows."""
+    arrays = {column: frame[column].to_numpy() for column in (columns or frame.columns)}
+    for start in range(0, len(frame), block_size):
+        yield {
+            column: array[start : start + block_size]
+            for column, array in arrays.items()
+        }
+
+
+@lru_cache(maxsize=64)
+def row_type(columns):
+    """Namedtuple class for a column tuple (invalid identifiers are renamed)."""
+    return namedtuple("Row", columns, rename=True)
+
+
+def iter_rows(frame, columns=None, block_size=BLOCK_SIZE):
+    """
+    Drop-in for itertuples() loops: yields Row(name=..., age=...) per row.
+
+    Each block is converted with tolist() (native Python values, one C call
+    per column) and zipped into namedtuples in C, so the per-row cost is a
+    single tuple allocation.
+    """
+    for block in iter_column_blocks(frame, columns, block_size):
+        make_row = row_type(tuple(block))._make
+        yield from map(make_row, zip(*(array.tolist() for array in block.values())))
+
+
+print("Using iter_rows():")
+for row in iter_rows(df, ["name", "age", "income"]):
+    print(f"{row.name} -> Age: {row.age}, Income: {row.income}")
+print(
+    "Blocks of 2 rows:", [len(b["age"]) for b in iter_column_blocks(df, block_size=2)]
+)
+print()
+
+
+def benchmark_row_access(n_rows=20_000):
+    """Labels incomes as High/Low five ways and returns rows/s per approach."""
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "name": np.array(["Alice", "Bob", "Charlie"])[np.arange(n_rows) % 3],
+            "age": rng.integers(18, 80, n_rows),
+            "income": rng.integers(10_000, 90_000, n_rows),
+        }
+    )
+
+    def with_iterrows():
+        return [
+            "High" if row["income"] > 40000 else "Low" for _, row in frame.iterrows()
+        ]
+
+    def with_itertuples():
+        return [
+            "High" if row.income > 40000 else "Low"
+            for row in frame.itertuples(index=False)
+        ]
+
+    def with_iter_rows():
+        return [
+            "High" if row.income > 40000 else "Low"
+            for row in iter_rows(frame, ["income"])
+        ]
+
+    def with_blocks():
+        labels = []
+        for block in iter_column_blocks(frame, ["income"]):
+            labels.extend(np.where(block["income"] > 40000, "High", "Low").tolist())
+        return labels
+
+    def with_np_where():
+        return np.where(frame["income"] > 40000, "High", "Low").tolist()
+
+    rates, expected = {}, None
+    for approach in (
+        with_iterrows,
+        with_itertuples,
+        with_iter_rows,
+        with_blocks,
+        with_np_where,
+    ):
+        start = time.perf_counter()
+        labels = approach()
+        rates[approach.__name__] = n_rows / (time.perf_counter() - start)
+        expected = labels if expected is None else expected
+        assert labels == expected, approach.__name__
+    return rates
+
+
+for approach_name, rate in benchmark_row_access().items():
+    print(f"{approach_name:<16}: {rate / 1e6:8.3f} M rows/s")
+print()
+
+# -------------------------------------------
+# 14. Streaming, NaN-aware Aggregation
+# -------------------------------------------
+print("14) Streaming, NaN-aware Aggregation")
+
+# Section 11 copies every valid item into `cleaned` before computing the
+# mean. StreamingStats keeps a constant-size running state instead (Welford's
+# update for the mean and variance), skips None/NaN as it goes, and merges
+# partial states (Chan et al.), so chunks can be aggregated independently.
+
+
+STATS_BLOCK = 8_192  # elements per NumPy reduction step in StreamingStats
+
+
+class StreamingStats:
+    """Single-pass count, sum, mean, variance, min and max; ignores None/NaN."""
+
+    __slots__ = ("count", "total", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self, source=None):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        if source is not None:
+            self.update(source)
+
+    def add(self, value):
+        """Adds one scalar (None and NaN are skipped)."""
+        if value is None or (
+            isinstance(value, (float, np.floating)) and math.isnan(value)
+        ):
+            return self
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        return self
+
+    def update(self, source):
+        """
+        Adds a scalar, an iterable of scalars or a NumPy chunk.
+
+        Scalars and iterables are folded in one at a time, without storing
+        them. A numeric chunk is reduced with NumPy in blocks of STATS_BLOCK
+        elements: each block's NaN-free copy and deviations are temporary
+        arrays, so extra memory stays bounded by the block size (cache-sized)
+        rather than growing with the chunk.
+        """
+        if isinstance(source, np.ndarray) and source.dtype.kind in "biuf":
+            flat = source.reshape(-1)
+            for start in range(0, flat.size, STATS_BLOCK):
+                self._merge_block(flat[start : start + STATS_BLOCK])
+        elif np.ndim(source) == 0 and not isinstance(source, (str, bytes)):
+            self.add(source)
+        else:
+            for value in source:
+                self.add(value)
+        return self
+
+    def _merge_block(self, block):
+        if block.dtype.kind == "f":
+            block = block[~np.isnan(block)]
+        if block.size:
+            block_state = StreamingStats()
+            block_state.count = block.size
+            block_state.total = float(block.sum())
+            block_state.mean = block_state.total / block.size
+            deviations = block - block_state.mean
+            block_state.m2 = float(np.dot(deviations, deviations))
+            block_state.minimum = block.min().item()
+            block_state.maximum = block.max().item()
+            self.merge(block_state)
+
+    def merge(self, other):
+        """Combines another partial state into this one (order-independent)."""
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        """Population variance (ddof=0); NaN when empty."""
+        return self.m2 / self.count if self.count else np.nan
+
+    @property
+    def sample_variance(self):
+        """Sample variance (ddof=1); NaN with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    def __repr__(self):
+        return (
+            f"StreamingStats(count={self.count}, mean={self.mean:.4g}, "
+            f"variance={self.variance:.4g}, min={self.minimum}, max={self.maximum})"
+        )
+
+
+stats = StreamingStats(dataset)
+print("Streaming stats:", stats)
+print("Same mean as section 11 ->", stats.mean == mean_value)
+
+# Chunks aggregated separately (e.g. one per worker) and merged afterwards
+samples = np.random.default_rng(5).normal(50, 10, 1_000_000)
+samples[::97] = np.nan
+partials = [StreamingStats(chunk) for chunk in np.array_split(samples, 8)]
+merged = StreamingStats()
+for partial in partials:
+    merged.merge(partial)
+print("Merged 8 chunks :", merged)
+print(
+    "Matches np.nanmean / np.nanvar ->",
+    np.isclose(merged.mean, np.nanmean(samples))
+    and np.isclose(merged.variance, np.nanvar(samples)),
+)
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+Module: Benchmark Suite for the for-loop Patterns
+Measures the claims of c7_for.py ("Performance Guard") instead of asserting them:
+- Reductions (mean), transforms (squares) and filters (ages 18-60)
+- Variants: explicit loop, comprehension, builtin sum, NumPy, chunked NumPy
+  and process-pool parallel (c7_for_parallel)
+- Several data sizes per run, best and median of repeated timings
+- Machine-readable JSON output for regression tracking and scaling curves
+- Runnable as an entry point: python c7_for_benchmarks.py --sizes 1000 100000
+- Native type hints
+- Pylint-clean code
+
+Author: Marcel Kaled
+Date: 2026-10-18
+Version: 1.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+
+from c7_for_parallel import (
+    parallel_filter,
+    parallel_map,
+    parallel_map_chunks,
+    planned_workers,
+)
+
+# --- Benchmark Defaults ---
+DEFAULT_SIZES: tuple[int, ...] = (10_000, 100_000, 1_000_000)
+DEFAULT_REPEATS: int = 3
+CHUNK_SIZE: int = 65_536  # elements per block for the chunked variants
+SEED: int = 0
+
+Variant = Callable[[np.ndarray], Any]
+
+
+# --- Per-item functions (module level, so pool workers can unpickle them) ---
+def square(value: int) -> int:
+    """x**2, as in the squared_evens comprehension."""
+    return value * value
+
+
+def chunk_sum(chunk: np.ndarray) -> int:
+    """Partial sum of one chunk, combined by the parent process."""
+    return int(chunk.sum())
+
+
+def is_working_age(age: int) -> bool:
+    """18 <= age <= 60, as in the adult_ages loop."""
+    return 18 <= age <= 60
+
+
+# --- Reduction: mean ---
+def mean_loop(values: np.ndarray) -> float:
+    """Explicit for loop with a running total."""
+    total: int = 0
+    count: int = 0
+    for value in values.tolist():
+        total += value
+        count += 1
+    return total / count
+
+
+def mean_builtin_sum_list(values: np.ndarray) -> float:
+    """Builtin sum over a Python list."""
+    items: list[int] = values.tolist()
+    return sum(items) / len(items)
+
+
+def mean_builtin_sum_array(values: np.ndarray) -> float:
+    """The commented-out line of section 12: builtin sum over the ndarray."""
+    return sum(values) / len(values)
+
+
+def mean_numpy(values: np.ndarray) -> float:
+    """Vectorized ndarray.mean()."""
+    return float(values.mean())
+
+
+def mean_chunked(values: np.ndarray) -> float:
+    """Block-wise NumPy sums, as a stream of chunks would be reduced."""
+    total: int = 0
+    for start in range(0, values.size, CHUNK_SIZE):
+        total += int(values[start : start + CHUNK_SIZE].sum())
+    return total / values.size
+
+
+def mean_parallel(values: np.ndarray) -> float:
+    """Partial sums in a process pool over shared memory, forced past the threshold."""
+    return sum(parallel_map_chunks(chunk_sum, values, None, 0)) / values.size
+
+
+# --- Transform: squares ---
+def square_loop(values: np.ndarray) -> np.ndarray:
+    """Explicit for loop with append."""
+    squares: list[int] = []
+    for value in values.tolist():
+        squares.append(value * value)
+    return np.array(squares)
+
+
+def square_comprehension(values: np.ndarray) -> np.ndarray:
+    """List comprehension."""
+    return np.array([value * value for value in values.tolist()])
+
+
+def square_numpy(values: np.ndarray) -> np.ndarray:
+    """Vectorized element-wise multiply."""
+    return values * values
+
+
+def square_chunked(values: np.ndarray) -> np.ndarray:
+    """Block-wise NumPy into a preallocated output."""
+    squares: np.ndarray = np.empty_like(values)
+    for start in range(0, values.size, CHUNK_SIZE):
+        block: np.ndarray = values[start : start + CHUNK_SIZE]
+        np.multiply(block, block, out=squares[start : start + CHUNK_SIZE])
+    return squares
+
+
+def square_parallel(values: np.ndarray) -> np.ndarray:
+    """Process pool over shared memory, forced past the serial threshold."""
+    return parallel_map(square, values, values.dtype, None, 0)
+
+
+# --- Filter: working ages ---
+def filter_loop(values: np.ndarray) -> np.ndarray:
+    """Explicit for loop with a condition, as in section 6."""
+    kept: list[int] = []
+    for age in values.tolist():
+        if 18 <= age <= 60:
+            kept.append(age)
+    return np.array(kept, dtype=values.dtype)
+
+
+def filter_comprehension(values: np.ndarray) -> np.ndarray:
+    """List comprehension with an if clause."""
+    return np.array(
+        [age for age in values.tolist() if 18 <= age <= 60], dtype=values.dtype
+    )
+
+
+def filter_numpy(values: np.ndarray) -> np.ndarray:
+    """Boolean mask."""
+    return values[(values >= 18) & (values <= 60)]
+
+
+def filter_parallel(values: np.ndarray) -> np.ndarray:
+    """Process pool over shared memory, forced past the serial threshold."""
+    return parallel_filter(is_working_age, values, None, 0)
+
+
+PARALLEL_VARIANTS: frozenset[str] = frozenset({"parallel"})  # run in a pool
+
+SUITE: dict[str, dict[str, Variant]] = {
+    "mean": {
+        "loop": mean_loop,
+        "builtin_sum_list": mean_builtin_sum_list,
+        "builtin_sum_array": mean_builtin_sum_array,
+        "numpy": mean_numpy,
+        "chunked": mean_chunked,
+        "parallel": mean_parallel,
+    },
+    "square": {
+        "loop": square_loop,
+        "comprehension": square_comprehension,
+        "numpy": square_numpy,
+        "chunked": square_chunked,
+        "parallel": square_parallel,
+    },
+    "filter": {
+        "loop": filter_loop,
+        "comprehension": filter_comprehension,
+        "numpy": filter_numpy,
+        "parallel": filter_parallel,
+    },
+}
+
+
+def _same_result(expected: Any, actual: Any) -> bool:
+    """Compares variant outputs (exactly for arrays, closely for floats)."""
+    if isinstance(expected, np.ndarray):
+        return np.array_equal(expected, actual)
+    return bool(np.isclose(expected, actual))
+
+
+def time_variant(variant: Variant, values: np.ndarray, repeats: int) -> list[float]:
+    """
+    Runs ``variant(values)`` ``repeats`` times.
+
+    Args:
+        variant (Variant): Function under test
+        values (np.ndarray): Input data
+        repeats (int): Number of timed runs
+
+    Returns:
+        list[float]: Wall-clock seconds per run
+    """
+    timings: list[float] = []
+    for _ in range(repeats):
+        began: float = time.perf_counter()
+        variant(values)
+        timings.append(time.perf_counter() - began)
+    return timings
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeats: int = DEFAULT_REPEATS,
+    benchmarks: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Times every variant of the selected benchmarks at every size.
+
+    All variants of a benchmark must return the same result as the first
+    one; a mismatch raises ``AssertionError`` instead of reporting a number.
+
+    Args:
+        sizes (tuple[int, ...]): Input sizes (number of elements)
+        repeats (int): Timed runs per variant and size
+        benchmarks (tuple[str, ...] | None): Names from ``SUITE``; all if None
+
+    Returns:
+        list[dict[str, Any]]: One record per (benchmark, variant, size),
+        including the number of pool ``workers`` it used
+
+    Raises:
+        ValueError: if ``repeats`` or any size is less than 1
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    if any(size < 1 for size in sizes):
+        raise ValueError(f"sizes must be at least 1, got {list(sizes)}")
+    rng = np.random.default_rng(SEED)
+    records: list[dict[str, Any]] = []
+    for size in sizes:
+        values: np.ndarray = rng.integers(0, 100, size, dtype=np.int64)
+        for benchmark in benchmarks or tuple(SUITE):
+            expected: Any = None
+            for variant_name, variant in SUITE[benchmark].items():
+                result: Any = variant(values)  # warm-up run, also checked
+                if expected is None:
+                    expected = result
+                elif not _same_result(expected, result):
+                    raise AssertionError(f"{benchmark}/{variant_name} disagrees")
+                timings: list[float] = time_variant(variant, values, repeats)
+                records.append(
+                    {
+                        "benchmark": benchmark,
+                        "variant": variant_name,
+                        "size": size,
+                        # Pool processes used; 0 means it ran in this process
+                        "workers": (
+                            planned_workers(size, None, 0)
+                            if variant_name in PARALLEL_VARIANTS
+                            else 0
+                        ),
+                        "best_s": min(timings),
+                        "median_s": statistics.median(timings),
+                        "items_per_s": size / min(timings),
+                    }
+                )
+    return records
+
+
+def environment() -> dict[str, Any]:
+    """Context needed to compare result files across machines and commits."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number: int = int(text)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Command-line options of the entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=_positive_int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        metavar="N",
+    )
+    parser.add_argument("--repeats", type=_positive_int, default=DEFAULT_REPEATS)
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=sorted(SUITE), metavar="NAME"
+    )
+    parser.add_argument(
+        "--output", default="-", help="JSON file to write ('-' for stdout)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the suite and writes the JSON report; prints a summary to stderr."""
+    args: argparse.Namespace = parse_args(argv)
+    records: list[dict[str, Any]] = run_suite(
+        tuple(args.sizes),
+        args.repeats,
+        tuple(args.benchmarks) if args.benchmarks else None,
+    )
+    report: dict[str, Any] = {
+        "environment": environment(),
+        "repeats": args.repeats,
+        "results": records,
+    }
+
+    text: str = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+
+    for record in records:
+        print(
+            f"{record['benchmark']:<7} {record['variant']:<18} "
+            f"workers={record['workers']}  "
+            f"n={record['size']:>10,}  {record['best_s'] * 1e3:10.3f} ms  "
+            f"{record['items_per_s'] / 1e6:9.2f} M items/s",
+            file=sys.stderr,
+        )
+
+
+# --- Entry Point ---
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Module: Parallel map/filter/reduce for CPU-heavy for-loop transforms
+Process-pool counterparts of the single-core loops in c7_for.py:
+- parallel_map: apply a per-item function, like [func(x) for x in values]
+- parallel_filter: keep items passing a predicate, like the adult_ages loop
+- parallel_map_chunks: per-chunk results (partial sums, ...) for reductions
+- Input and output live in shared-memory NumPy buffers: workers receive only
+  the buffer names and a slice range, nothing is pickled per element
+- Output order matches input order
+- Serial fallback below a size threshold; planned_workers() reports the path
+- Native type hints
+- Pylint-clean code
+
+Author: Marcel Kaled
+Date: 2026-10-18
+Version: 1.1
+"""
+
+import math
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# --- Parallel Defaults ---
+PARALLEL_THRESHOLD: int = 50_000  # below this many items, run serially
+CHUNKS_PER_WORKER: int = 4  # more chunks than workers evens out uneven items
+
+
+class _SharedArray(NamedTuple):
+    """Picklable description of a NumPy array stored in shared memory."""
+
+    name: str
+    dtype: str
+    length: int
+
+
+def _attach(spec: _SharedArray) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Opens a shared block by name and returns it with its array view."""
+    block = shared_memory.SharedMemory(name=spec.name)
+    return block, np.ndarray(spec.length, dtype=spec.dtype, buffer=block.buf)
+
+
+def _run_chunk(
+    func: Callable[[Any], Any],
+    source: _SharedArray,
+    target: _SharedArray,
+    bounds: tuple[int, int],
+) -> int:
+    """
+    Worker: writes func(item) for source[start:stop] into target[start:stop].
+
+    Args:
+        func (Callable[[Any], Any]): Picklable (module-level) per-item function
+        source (_SharedArray): Shared input buffer
+        target (_SharedArray): Shared output buffer
+        bounds (tuple[int, int]): Half-open slice ``(start, stop)`` to process
+
+    Returns:
+        int: Number of items processed
+    """
+    start, stop = bounds
+    source_block, items = _attach(source)
+    target_block, results = _attach(target)
+    try:
+        # tolist() yields native Python values, which per-item code expects
+        results[start:stop] = [func(item) for item in items[start:stop].tolist()]
+    finally:
+        del items, results  # release the buffer views before closing
+        source_block.close()
+        target_block.close()
+    return stop - start
+
+
+def _chunk_bounds(length: int, n_chunks: int) -> list[tuple[int, int]]:
+    """Splits ``range(length)`` into at most ``n_chunks`` contiguous slices."""
+    size: int = max(1, math.ceil(length / n_chunks))
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def _create_shared(
+    blocks: list[shared_memory.SharedMemory], dtype: np.dtype, length: int
+) -> tuple[_SharedArray, np.ndarray]:
+    """Allocates a shared array, tracked in ``blocks`` for later cleanup."""
+    block = shared_memory.SharedMemory(
+        create=True, size=max(1, length * dtype.itemsize)
+    )
+    blocks.append(block)
+    spec = _SharedArray(block.name, dtype.str, length)
+    return spec, np.ndarray(length, dtype=dtype, buffer=block.buf)
+
+
+def _release(blocks: list[shared_memory.SharedMemory]) -> None:
+    """Closes and unlinks every shared block created by this process."""
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _apply(
+    func: Callable[[Any], Any],
+    values: np.ndarray,
+    out_dtype: np.dtype,
+    max_workers: int,
+) -> np.ndarray:
+    """Runs ``func`` over ``values`` in a process pool via shared memory."""
+    blocks: list[shared_memory.SharedMemory] = []
+    items = results = None  # buffer views, released before the blocks close
+    try:
+        source, items = _create_shared(blocks, values.dtype, values.size)
+        target, results = _create_shared(blocks, out_dtype, values.size)
+        items[:] = values
+
+        bounds = _chunk_bounds(values.size, max_workers * CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # list() re-raises the first worker exception, if any
+            list(
+                executor.map(
+                    _run_chunk, *zip(*[(func, source, target, b) for b in bounds])
+                )
+            )
+        return results.copy()
+    finally:
+        del items, results
+        _release(blocks)
+
+
+def _reduce_chunk(
+    func: Callable[[np.ndarray], Any], source: _SharedArray, bounds: tuple[int, int]
+) -> Any:
+    """Worker: returns ``func(source[start:stop])``, computed on the shared view."""
+    block, items = _attach(source)
+    try:
+        return func(items[bounds[0] : bounds[1]])
+    finally:
+        del items
+        block.close()
+
+
+def planned_workers(
+    size: int, max_workers: int | None = None, threshold: int = PARALLEL_THRESHOLD
+) -> int:
+    """
+    Number of worker processes a call on ``size`` items will start.
+
+    Args:
+        size (int): Number of input items
+        max_workers (int | None): Requested workers; defaults to ``os.cpu_count()``
+        threshold (int): Inputs smaller than this run serially
+
+    Returns:
+        int: ``0`` for the serial path, otherwise the pool size. An explicit
+        ``max_workers`` (or ``threshold=0``) is honoured even on one CPU.
+    """
+    if size < threshold:
+        return 0
+    return max_workers or os.cpu_count() or 1
+
+
+def _prepare(values: Any) -> np.ndarray:
+    """Validates the input: a flat array with a fixed-size (shareable) dtype."""
+    array: np.ndarray = np.ascontiguousarray(values).reshape(-1)
+    if array.dtype.hasobject:
+        raise TypeError("values must have a fixed-size dtype to be shared")
+    return array
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    values: Any,
+    out_dtype: Any = np.float64,
+    max_workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> np.ndarray:
+    """
+    Parallel ``np.array([func(x) for x in values], dtype=out_dtype)``.
+
+    Args:
+        func (Callable[[Any], Any]): Picklable (module-level) per-item function
+        values (Any): Array-like with a fixed-size dtype (numbers, bools, bytes)
+        out_dtype (Any): Dtype of the result array
+        max_workers (int | None): Worker processes; defaults to ``os.cpu_count()``
+        threshold (int): Inputs smaller than this run serially; ``0`` forces
+            the process pool even on a single CPU
+
+    Returns:
+        np.ndarray: ``func`` applied to every item, in input order
+    """
+    array: np.ndarray = _prepare(values)
+    workers: int = planned_workers(array.size, max_workers, threshold)
+    dtype: np.dtype = np.dtype(out_dtype)
+    if workers == 0:
+        return np.array([func(item) for item in array.tolist()], dtype=dtype)
+    return _apply(func, array, dtype, workers)
+
+
+def parallel_filter(
+    predicate: Callable[[Any], bool],
+    values: Any,
+    max_workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> np.ndarray:
+    """
+    Parallel ``np.array([x for x in values if predicate(x)])``.
+
+    Workers only evaluate the predicate into a shared boolean mask; the
+    selection itself is a single ``values[mask]`` in the parent, which keeps
+    the surviving items in input order.
+
+    Args:
+        predicate (Callable[[Any], bool]): Picklable (module-level) test
+        values (Any): Array-like with a fixed-size dtype
+        max_workers (int | None): Worker processes; defaults to ``os.cpu_count()``
+        threshold (int): Inputs smaller than this run serially; ``0`` forces
+            the process pool even on a single CPU
+
+    Returns:
+        np.ndarray: Items for which ``predicate`` is true, in input order
+    """
+    array: np.ndarray = _prepare(values)
+    workers: int = planned_workers(array.size, max_workers, threshold)
+    if workers == 0:
+        mask = np.array([bool(predicate(item)) for item in array.tolist()], dtype=bool)
+    else:
+        mask = _apply(predicate, array, np.dtype(bool), workers)
+    return array[mask]
+
+
+def parallel_map_chunks(
+    func: Callable[[np.ndarray], Any],
+    values: Any,
+    max_workers: int | None = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> list[Any]:
+    """
+    Applies a chunk-level function (e.g. a partial sum) to contiguous slices.
+
+    Workers read their slice straight from shared memory and send back only
+    ``func``'s result, so this suits reductions: combine the returned partial
+    results in the caller. ``func`` must return a new object, not a view of
+    its input (the shared buffer is closed afterwards).
+
+    Args:
+        func (Callable[[np.ndarray], Any]): Picklable (module-level) function
+        values (Any): Array-like with a fixed-size dtype
+        max_workers (int | None): Worker processes; defaults to ``os.cpu_count()``
+        threshold (int): Inputs smaller than this run serially; ``0`` forces
+            the process pool even on a single CPU
+
+    Returns:
+        list[Any]: One result per chunk, in input order (a single chunk on the
+        serial path)
+    """
+    array: np.ndarray = _prepare(values)
+    workers: int = planned_workers(array.size, max_workers, threshold)
+    if workers == 0:
+        return [func(array)]
+    blocks: list[shared_memory.SharedMemory] = []
+    items = None  # buffer view, released before the block closes
+    try:
+        source, items = _create_shared(blocks, array.dtype, array.size)
+        items[:] = array
+        bounds = _chunk_bounds(array.size, workers * CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    _reduce_chunk, [func] * len(bounds), [source] * len(bounds), bounds
+                )
+            )
+    finally:
+        del items
+        _release(blocks)
+
+
+# --- Example per-item functions (module level, so workers can unpickle them) ---
+def collatz_steps(n: int) -> int:
+    """Number of Collatz steps to reach 1: a loop that cannot be vectorized."""
+    steps: int = 0
+    while n > 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        steps += 1
+    return steps
+
+
+def is_working_age(age: int) -> bool:
+    """Same condition as the adult_ages loop in c7_for.py."""
+    return 18 <= age <= 60
+
+
+def process_id(_item: Any) -> int:
+    """PID of the process evaluating an item (shows where work really ran)."""
+    return os.getpid()
+
+
+def benchmark_parallel(n_items: int = 200_000) -> dict[str, float]:
+    """
+    Times serial vs parallel ``collatz_steps`` over ``n_items`` integers.
+
+    Args:
+        n_items (int): Number of inputs
+
+    Returns:
+        dict[str, float]: Seconds per variant and the pool size actually used
+    """
+    values: np.ndarray = np.arange(1, n_items + 1, dtype=np.int64)
+    timings: dict[str, float] = {"workers": float(planned_workers(n_items, None, 0))}
+    results: list[np.ndarray] = []
+    for label, threshold in (("serial", n_items + 1), ("parallel", 0)):
+        began: float = time.perf_counter()
+        results.append(parallel_map(collatz_steps, values, np.int32, None, threshold))
+        timings[label] = time.perf_counter() - began
+    if not np.array_equal(results[0], results[1]):
+        raise AssertionError("parallel result differs from serial result")
+    return timings
+
+
+def main() -> None:
+    """Demonstrates parallel_map / parallel_filter and prints the benchmark."""
+    ages: list[int] = [12, 25, 37, 51, 68]
+    print("Adults (18-60):", parallel_filter(is_working_age, ages).tolist())
+    print(
+        "Collatz steps (forced parallel):",
+        parallel_map(collatz_steps, range(1, 11), np.int32, 2, 0).tolist(),
+    )
+
+    pids: np.ndarray = parallel_map(process_id, np.zeros(8), np.int64, None, 0)
+    print("Forced pool ran outside this process:", os.getpid() not in pids)
+
+    timings: dict[str, float] = benchmark_parallel()
+    print(f"Pool workers used: {timings['workers']:.0f}")
+    print(f"Serial  : {timings['serial']:.3f}s")
+    print(f"Parallel: {timings['parallel']:.3f}s")
+
+
+# --- Entry Point ---
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ This script demonstrates:
 - Real-time data simulation
 - Convergence of numerical calculations
 - Safe break conditions to avoid infinite loops
+- Single-copy outlier trimming with running sums
 """
 
 import random
@@ -150,3 +151,128 @@ if np.mean(collected) >= DESIRED_MEAN:
     print("- Desired mean reached.")
 else:
     print("- Maximum iterations reached.")
+
+# --------------------------------------------------------
+# 5. Fast Iterative Outlier Removal (running sums)
+# --------------------------------------------------------
+print("\n[5] Fast Iterative Outlier Removal")
+print("--------------------------------")
+
+# Section 1 recomputes mean/std over the whole frame and copies it on every
+# pass: O(k*n) for k passes. But a pass only ever removes the most extreme
+# points, so the survivors are always one contiguous run [lo, hi) of the
+# sorted values. Keeping a running sum and sum of squares for that run, each
+# pass only subtracts the tails it removes and finds the new bounds with two
+# binary searches; the frame is indexed once, at the end.
+
+BENCHMARK_SIZE = 1_000_000  # heavy-tailed points for the speed comparison
+REFRESH_RATIO = 1e3  # max (sum of squares / centred sum of squares) kept
+
+
+def centred_moments(run):
+    """Returns (shift, sum, sum of squares) of `run` centred on its mean."""
+    shift = float(run.mean())
+    deviations = run - shift
+    return shift, float(deviations.sum()), float(np.dot(deviations, deviations))
+
+
+def drop_tails(ordered, old_bounds, new_bounds, moments):
+    """Moments of ordered[new_bounds] from those of ordered[old_bounds]."""
+    (lo, hi), (new_lo, new_hi) = old_bounds, new_bounds
+    shift, total, squares = moments
+    tails = np.concatenate((ordered[lo:new_lo], ordered[new_hi:hi])) - shift
+    new_total = total - float(tails.sum())
+    new_squares = squares - float(np.dot(tails, tails))
+    # The variance comes from squares - total**2 / n; when the removed tails
+    # (or the drift of the mean away from `shift`) dominate, that subtraction
+    # cancels most significant digits, so re-centre on the surviving run.
+    centred = new_squares - new_total * new_total / (new_hi - new_lo)
+    if centred * REFRESH_RATIO < squares:
+        return centred_moments(ordered[new_lo:new_hi])
+    return shift, new_total, new_squares
+
+
+def trim_outliers(values, threshold=THRESHOLD):
+    """
+    Same fixed point as the section 1 loop, without copying per pass.
+
+    Returns (mask, passes): `mask` marks the surviving values in their
+    original order (NaN is never kept) and `passes` counts loop iterations
+    the way ITERATION does, including the final pass that finds nothing.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    ordered = np.sort(values[~np.isnan(values)])
+    bounds, passes = (0, ordered.size), 0
+    if not ordered.size:
+        return np.zeros(values.shape, dtype=bool), passes
+    moments = centred_moments(ordered)
+
+    while bounds[1] > bounds[0]:
+        passes += 1
+        shift, total, squares = moments
+        count = bounds[1] - bounds[0]
+        mean = shift + total / count
+        spread = threshold * np.sqrt(max(squares / count - (total / count) ** 2, 0))
+        if spread == 0:
+            break  # No variation left (section 1's safety guard)
+        new_bounds = (
+            max(bounds[0], int(np.searchsorted(ordered, mean - spread, "left"))),
+            min(bounds[1], int(np.searchsorted(ordered, mean + spread, "right"))),
+        )
+        if new_bounds == bounds:
+            break  # No outliers left: fixed point reached
+        if new_bounds[1] > new_bounds[0]:
+            moments = drop_tails(ordered, bounds, new_bounds, moments)
+        bounds = new_bounds
+
+    if bounds[1] <= bounds[0]:
+        return np.zeros(values.shape, dtype=bool), passes
+    return (values >= ordered[bounds[0]]) & (values <= ordered[bounds[1] - 1]), passes
+
+
+def trim_outliers_by_loop(values, threshold=THRESHOLD):
+    """Section 1's loop on a Series (reference for trim_outliers)."""
+    remaining = pd.Series(values).dropna()
+    while not remaining.empty and remaining.std(ddof=0) != 0:
+        scores = (remaining - remaining.mean()) / remaining.std(ddof=0)
+        if not (np.abs(scores) > threshold).any():
+            break
+        remaining = remaining[np.abs(scores) <= threshold]
+    return remaining
+
+
+raw_df = pd.DataFrame({VALUE_COL: data})
+keep, passes_used = trim_outliers(raw_df[VALUE_COL].to_numpy())
+trimmed = raw_df[keep]  # The only copy of the frame
+print(f"Kept {len(trimmed)} of {len(raw_df)} rows in {passes_used} passes")
+print("Same rows as section 1 ->", trimmed.index.equals(df.index))
+
+# Inputs where a single huge outlier dominates the sums
+edge_rng = np.random.default_rng(RNG_SEED)
+for label, sample in (
+    ("-1e10 + N(0,1)", np.r_[-1e10, edge_rng.normal(0, 1, 1000)]),
+    ("+-1e9 + N(0,1)", np.r_[-1e9, 1e9, edge_rng.normal(0, 1, 1000)]),
+    ("t(1.5) + NaNs ", np.r_[edge_rng.standard_t(1.5, 5000), [np.nan] * 50]),
+):
+    keep, passes_used = trim_outliers(sample)
+    reference = trim_outliers_by_loop(sample)
+    print(
+        f"{label}: kept {keep.sum()} in {passes_used} passes, same rows as loop ->",
+        np.array_equal(np.flatnonzero(keep), reference.index),
+    )
+
+# Benchmark on heavy-tailed data, where section 1 needs many passes
+heavy = pd.DataFrame({VALUE_COL: np.random.standard_t(2, BENCHMARK_SIZE)})
+
+start = time.perf_counter()
+looped = heavy.loc[trim_outliers_by_loop(heavy[VALUE_COL]).index]
+loop_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+keep, passes_used = trim_outliers(heavy[VALUE_COL].to_numpy())
+fast = heavy[keep]
+fast_seconds = time.perf_counter() - start
+
+print(f"Section 1 loop : {loop_seconds:.3f}s")
+print(f"trim_outliers  : {fast_seconds:.3f}s ({passes_used} passes)")
+print("Same rows ->", fast.index.equals(looped.index))